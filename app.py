@@ -5,28 +5,40 @@ AI採用支援システム - Webアプリケーション
 """
 
 import os
-import json
 import sys
+import gzip
+import hashlib
+import multiprocessing
+import threading
+import time
+import zlib
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
-from werkzeug.utils import secure_filename
-import tempfile
-import zipfile
-from io import BytesIO
+from flask import Flask, render_template, request
+import orjson
 
-# srcディレクトリを追加
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:
+    detect_charset = None
+
+# srcディレクトリを追加（再読み込み時に重複追加しない）
+SRC_DIR = str(Path(__file__).parent / 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 try:
     from src.hr_recruitment_system import (
-        ResumeAnalyzer, CandidateMatcher, CompanyProfile, JobRequirement
+        ResumeAnalyzer, CandidateMatcher, CompanyProfile, JobRequirement,
+        analyze_candidates_batch, BATCH_PARALLEL_MIN
     )
     from src.interview_system import InterviewQuestionGenerator, InterviewStage
 except ImportError:
-    # Vercel環境での代替インポート
+    # Vercel環境での代替インポート（通常のインポートに失敗した場合のみ実行）
     import importlib.util
-    import os
     
     # hr_recruitment_system
     spec1 = importlib.util.spec_from_file_location(
@@ -49,6 +61,8 @@ except ImportError:
     CandidateMatcher = hr_module.CandidateMatcher
     CompanyProfile = hr_module.CompanyProfile
     JobRequirement = hr_module.JobRequirement
+    analyze_candidates_batch = hr_module.analyze_candidates_batch
+    BATCH_PARALLEL_MIN = hr_module.BATCH_PARALLEL_MIN
     InterviewQuestionGenerator = iv_module.InterviewQuestionGenerator
     InterviewStage = iv_module.InterviewStage
 
@@ -56,11 +70,33 @@ app = Flask(__name__)
 app.secret_key = 'hr_system_secret_key_2024'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# JSONレスポンスはorjsonでシリアライズ（日本語をエスケープせずUTF-8のまま出力）
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+
+def ojsonify(obj):
+    """orjsonでシリアライズしたJSONレスポンスを返す"""
+    return json_payload_response(orjson.dumps(obj, option=ORJSON_OPTIONS))
+
+def json_payload_response(payload):
+    """シリアライズ済みJSONをレスポンスとして返す"""
+    return app.response_class(payload, mimetype='application/json')
+
+# タイムスタンプ文字列キャッシュ（秒単位で再生成）
+_ts_cache = [0, ""]
+
+def now_iso():
+    """現在時刻のISO形式文字列（同一秒内は生成済みの文字列を再利用）"""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[1] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[0] = now
+    return _ts_cache[1]
+
 # デバッグ用エラーハンドリング
 @app.errorhandler(500)
 def internal_error(error):
     import traceback
-    return jsonify({
+    return ojsonify({
         'error': 'Internal Server Error',
         'message': str(error),
         'traceback': traceback.format_exc()
@@ -69,16 +105,21 @@ def internal_error(error):
 @app.errorhandler(Exception)
 def handle_exception(e):
     import traceback
-    return jsonify({
+    return ojsonify({
         'error': 'Unhandled Exception',
         'message': str(e),
         'traceback': traceback.format_exc()
     }), 500
 
 # アップロード設定
-UPLOAD_FOLDER = Path('uploads')
-UPLOAD_FOLDER.mkdir(exist_ok=True)
-ALLOWED_EXTENSIONS = {'txt', 'pdf', 'doc', 'docx'}
+ALLOWED_EXTENSIONS = frozenset({'.txt', '.pdf', '.doc', '.docx'})
+
+# ダウンロード設定
+DOWNLOAD_GZIP_LEVEL = 1  # 速度優先の圧縮レベル
+
+# 一括分析設定
+MAX_BATCH_FILES = 50
+BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', 0)) or None  # 未指定時はCPUコア数
 
 # グローバル設定
 company_profile = CompanyProfile(
@@ -90,8 +131,8 @@ company_profile = CompanyProfile(
     work_style=["完全リモートワーク", "フレックスタイム", "副業OK", "海外勤務可能"]
 )
 
-# 求人要件
-job_requirements = {
+# 求人要件（起動時に一度だけ構築し、読み取り専用で共有）
+job_requirements = MappingProxyType({
     "シニアWebエンジニア": JobRequirement(
         position_title="シニアWebエンジニア",
         department="プロダクト開発部",
@@ -144,30 +185,175 @@ job_requirements = {
         remote_work=True,
         travel_required=True
     )
-}
+})
 
 # 分析エンジン初期化
 analyzer = ResumeAnalyzer()
 matcher = CandidateMatcher(company_profile)
 question_generator = InterviewQuestionGenerator()
 
+# 一括分析用のプロセスプール（ワーカープロセスごとに1つ、初回の一括分析時に作成）
+_batch_executor = None
+_batch_executor_unavailable = False
+_batch_executor_lock = threading.Lock()
+
+def get_batch_executor():
+    """
+    一括分析用のプロセスプールを取得（作成できない環境では None）
+
+    gthread ワーカーはマルチスレッドのため、fork ではなく forkserver で子プロセスを起動する。
+    子プロセスは投入された件数に応じて max_workers まで必要な分だけ起動される
+    """
+    global _batch_executor, _batch_executor_unavailable
+    with _batch_executor_lock:
+        if _batch_executor is None and not _batch_executor_unavailable:
+            try:
+                _batch_executor = ProcessPoolExecutor(
+                    max_workers=BATCH_MAX_WORKERS or os.cpu_count(),
+                    mp_context=multiprocessing.get_context('forkserver')
+                )
+            except (OSError, NotImplementedError, ValueError) as e:
+                # マルチプロセスが使えない環境（サーバーレス等）では以後も逐次処理
+                _batch_executor_unavailable = True
+                app.logger.warning(f"プロセスプールを利用できないため逐次処理します: {e}")
+        return _batch_executor
+
+def discard_batch_executor(executor):
+    """子プロセスの異常終了で使えなくなったプールを破棄（次回の一括分析で作り直す）"""
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is executor:
+            _batch_executor = None
+    executor.shutdown(wait=False)
+
+def run_analysis_batch(tasks):
+    """履歴書の一括分析（少数なら逐次、それ以外は共有プールで並列に処理）"""
+    executor = get_batch_executor() if len(tasks) >= BATCH_PARALLEL_MIN else None
+    if executor is None:
+        return analyze_candidates_batch(tasks, max_workers=1)
+    try:
+        return analyze_candidates_batch(tasks, executor=executor)
+    except BrokenExecutor:
+        discard_batch_executor(executor)
+        return analyze_candidates_batch(tasks, max_workers=1)
+
+# 分析結果キャッシュ（履歴書ハッシュ・職種 → 候補者プロファイルとマッチング結果）
+# 面接質問はランダムに選ぶため、タイムスタンプとともにリクエストごとに作成する
+ANALYSIS_CACHE_SIZE = 512
+_analysis_cache = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+def resume_hash(resume_text):
+    """履歴書テキストのSHA-256ハッシュを計算"""
+    return hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+
+def analyze_with_cache(resume_text, job_position):
+    """履歴書を分析してマッチング評価（同一履歴書・職種の結果は再利用）"""
+    cache_key = (resume_hash(resume_text), job_position)
+    with _analysis_cache_lock:
+        analysis = _analysis_cache.get(cache_key)
+        if analysis is not None:
+            _analysis_cache.move_to_end(cache_key)
+            return analysis
+    
+    candidate = analyzer.extract_candidate_profile(resume_text)
+    matching_result = matcher.calculate_match_score(candidate, job_requirements[job_position])
+    analysis = (candidate, matching_result)
+    with _analysis_cache_lock:
+        _analysis_cache[cache_key] = analysis
+        _analysis_cache.move_to_end(cache_key)
+        while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return analysis
+
+def candidate_summary(candidate):
+    """レスポンス用の候補者情報"""
+    return {
+        'name': candidate.name,
+        'email': candidate.email,
+        'experience_years': candidate.experience_years,
+        'skills': candidate.skills[:10],  # 上位10スキルのみ
+        'education': candidate.education,
+        'certifications': candidate.certifications,
+        'languages': candidate.languages
+    }
+
+def evaluation_summary(matching_result):
+    """レスポンス用の評価結果"""
+    return {
+        'overall_score': round(matching_result.overall_score, 1),
+        'skill_match_score': round(matching_result.skill_match_score, 1),
+        'experience_match_score': round(matching_result.experience_match_score, 1),
+        'culture_fit_score': round(matching_result.culture_fit_score, 1),
+        'education_match_score': round(matching_result.education_match_score, 1),
+        'recommendation': matching_result.recommendation,
+        'interview_focus_areas': matching_result.interview_focus_areas,
+        'detailed_analysis': matching_result.detailed_analysis
+    }
+
+def interview_question_summary(question):
+    """レスポンス用の面接質問"""
+    return {
+        'category': question.category.value,
+        'question': question.question,
+        'evaluation_points': question.evaluation_points,
+        'time_limit_minutes': question.time_limit_minutes,
+        'follow_up_questions': question.follow_up_questions,
+        'good_answer_example': question.good_answer_example,
+        'red_flags': question.red_flags
+    }
+
+def build_result(candidate, matching_result, interview_plan, job_position, demo_mode=False):
+    """分析APIのレスポンスを作成"""
+    result = {
+        'candidate': candidate_summary(candidate),
+        'evaluation': evaluation_summary(matching_result),
+        'interview_questions': [interview_question_summary(q) for q in interview_plan.questions],
+        'special_notes': interview_plan.special_notes,
+        'job_position': job_position,
+        'analysis_timestamp': now_iso()
+    }
+    if demo_mode:
+        result['demo_mode'] = True
+    return result
+
+def decode_resume_bytes(raw):
+    """履歴書のバイト列をテキストにデコード（UTF-8 → 文字コード自動判定 → Shift_JIS の順で試行）"""
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    if detect_charset is not None:
+        best = detect_charset(raw).best()
+        if best is not None:
+            return str(best)
+    
+    return raw.decode('shift_jis', errors='replace')
+
+def read_uploaded_text(file):
+    """アップロードされたファイルからテキストを抽出（ディスクを経由せずメモリ上で処理）"""
+    return decode_resume_bytes(file.stream.read())
+
+def request_too_large():
+    """リクエスト本文がサイズ上限を超えているか（Content-Lengthで判定）"""
+    content_length = request.content_length
+    return content_length is not None and content_length > app.config['MAX_CONTENT_LENGTH']
+
+def request_too_large_response():
+    """サイズ超過時のエラーレスポンス"""
+    max_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    return ojsonify({'error': f'ファイルサイズが上限（{max_mb}MB）を超えています'}), 413
+
 def allowed_file(filename):
     """アップロード可能なファイル形式かチェック"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return Path(filename).suffix.lower() in ALLOWED_EXTENSIONS
 
 def extract_text_from_file(filepath):
     """ファイルからテキストを抽出"""
     try:
-        # シンプルなテキストファイルとして読み込み
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
-    except UnicodeDecodeError:
-        # UTF-8で読み込めない場合はShift_JISで試行
-        try:
-            with open(filepath, 'r', encoding='shift_jis') as f:
-                return f.read()
-        except:
-            return "ファイル読み込みエラー: テキストファイル(.txt)をアップロードしてください"
+        # バイト列として一度だけ読み込み、メモリ上でデコード
+        return decode_resume_bytes(Path(filepath).read_bytes())
     except Exception as e:
         return f"ファイル読み込みエラー: {str(e)}"
 
@@ -180,93 +366,114 @@ def index():
 def analyze_resume():
     """履歴書分析API"""
     try:
+        # サイズ超過は本文を読み込む前に拒否
+        if request_too_large():
+            return request_too_large_response()
+        
+        # 職種取得
+        job_position = request.form.get('job_position')
+        if job_position not in job_requirements:
+            return ojsonify({'error': '無効な職種が選択されています'}), 400
+        
         # ファイル取得
         if 'resume_file' not in request.files:
-            return jsonify({'error': 'ファイルが選択されていません'}), 400
+            return ojsonify({'error': 'ファイルが選択されていません'}), 400
         
         file = request.files['resume_file']
         if file.filename == '':
-            return jsonify({'error': 'ファイルが選択されていません'}), 400
+            return ojsonify({'error': 'ファイルが選択されていません'}), 400
         
         if not allowed_file(file.filename):
-            return jsonify({'error': '対応していないファイル形式です。テキストファイル(.txt)をアップロードしてください'}), 400
-        
-        # 職種取得
-        job_position = request.form.get('job_position')
-        if job_position not in job_requirements:
-            return jsonify({'error': '無効な職種が選択されています'}), 400
-        
-        # ファイル保存
-        filename = secure_filename(file.filename)
-        temp_path = UPLOAD_FOLDER / filename
-        file.save(temp_path)
+            return ojsonify({'error': '対応していないファイル形式です。テキストファイル(.txt)をアップロードしてください'}), 400
         
         # テキスト抽出
-        resume_text = extract_text_from_file(temp_path)
+        resume_text = read_uploaded_text(file)
         
-        # 履歴書分析
-        candidate = analyzer.extract_candidate_profile(resume_text)
-        
-        # マッチング評価
-        job_req = job_requirements[job_position]
-        matching_result = matcher.calculate_match_score(candidate, job_req)
+        # 履歴書分析・マッチング評価（同一履歴書・職種の分析済み結果があれば再利用）
+        candidate, matching_result = analyze_with_cache(resume_text, job_position)
         
         # 面接計画生成（1次面接）
         interview_plan = question_generator.generate_interview_plan(
-            candidate, job_req, matching_result, InterviewStage.FIRST
+            candidate, job_requirements[job_position], matching_result, InterviewStage.FIRST
         )
         
         # 結果作成
-        result = {
-            'candidate': {
-                'name': candidate.name,
-                'email': candidate.email,
-                'experience_years': candidate.experience_years,
-                'skills': candidate.skills[:10],  # 上位10スキルのみ
-                'education': candidate.education,
-                'certifications': candidate.certifications,
-                'languages': candidate.languages
-            },
-            'evaluation': {
-                'overall_score': round(matching_result.overall_score, 1),
-                'skill_match_score': round(matching_result.skill_match_score, 1),
-                'experience_match_score': round(matching_result.experience_match_score, 1),
-                'culture_fit_score': round(matching_result.culture_fit_score, 1),
-                'education_match_score': round(matching_result.education_match_score, 1),
-                'recommendation': matching_result.recommendation,
-                'interview_focus_areas': matching_result.interview_focus_areas,
-                'detailed_analysis': matching_result.detailed_analysis
-            },
-            'interview_questions': [
-                {
-                    'category': q.category.value,
-                    'question': q.question,
-                    'evaluation_points': q.evaluation_points,
-                    'time_limit_minutes': q.time_limit_minutes,
-                    'follow_up_questions': q.follow_up_questions,
-                    'good_answer_example': q.good_answer_example,
-                    'red_flags': q.red_flags
-                }
-                for q in interview_plan.questions
-            ],
-            'special_notes': interview_plan.special_notes,
-            'job_position': job_position,
-            'analysis_timestamp': datetime.now().isoformat()
-        }
+        result = build_result(candidate, matching_result, interview_plan, job_position)
+        
+        return ojsonify(result)
         
-        # 一時ファイル削除
-        temp_path.unlink()
+    except Exception as e:
+        return ojsonify({'error': f'分析中にエラーが発生しました: {str(e)}'}), 500
+
+@app.route('/analyze_batch', methods=['POST'])
+def analyze_batch():
+    """履歴書一括分析API（複数ファイルを並列に分析）"""
+    try:
+        if request_too_large():
+            return request_too_large_response()
+        
+        files = [f for f in request.files.getlist('resume_files') if f.filename]
+        if not files:
+            return ojsonify({'error': 'ファイルが選択されていません'}), 400
+        
+        if len(files) > MAX_BATCH_FILES:
+            return ojsonify({'error': f'一度に分析できるファイルは{MAX_BATCH_FILES}件までです'}), 400
+        
+        # 職種取得（1件のみ指定時は全ファイルに適用）
+        job_positions = request.form.getlist('job_position')
+        if len(job_positions) == 1:
+            job_positions = job_positions * len(files)
+        if len(job_positions) != len(files):
+            return ojsonify({'error': '職種の指定数がファイル数と一致しません'}), 400
+        if any(position not in job_requirements for position in job_positions):
+            return ojsonify({'error': '無効な職種が選択されています'}), 400
+        
+        # 読み込めないファイルは失敗として記録し、残りを分析
+        failures = []
+        items = []
+        for file, job_position in zip(files, job_positions):
+            if not allowed_file(file.filename):
+                failures.append({
+                    'filename': file.filename,
+                    'error': '対応していないファイル形式です。テキストファイル(.txt)をアップロードしてください'
+                })
+                continue
+            items.append((file.filename, job_position, read_uploaded_text(file)))
+        
+        tasks = [
+            (resume_text, job_requirements[job_position], company_profile)
+            for _, job_position, resume_text in items
+        ]
+        analyses, analysis_failures = run_analysis_batch(tasks)
         
-        return jsonify(result)
+        results = []
+        for index, (filename, job_position, _) in enumerate(items):
+            if index in analysis_failures:
+                failures.append({'filename': filename, 'error': analysis_failures[index]})
+                continue
+            candidate, matching_result = analyses[index]
+            results.append({
+                'filename': filename,
+                'job_position': job_position,
+                'candidate': candidate_summary(candidate),
+                'evaluation': evaluation_summary(matching_result)
+            })
+        
+        return ojsonify({
+            'results': results,
+            'failures': failures,
+            'total': len(files),
+            'analysis_timestamp': now_iso()
+        })
         
     except Exception as e:
-        return jsonify({'error': f'分析中にエラーが発生しました: {str(e)}'}), 500
+        return ojsonify({'error': f'一括分析中にエラーが発生しました: {str(e)}'}), 500
 
 @app.route('/interview/<stage>')
 def generate_interview(stage):
     """面接質問生成（2次面接・最終面接）"""
     # TODO: より詳細な面接質問生成実装
-    return jsonify({'message': f'{stage}面接質問生成機能は開発中です'})
+    return ojsonify({'message': f'{stage}面接質問生成機能は開発中です'})
 
 @app.route('/download_result', methods=['POST'])
 def download_result():
@@ -277,19 +484,22 @@ def download_result():
         # JSON形式で保存
         filename = f"evaluation_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        # メモリ上でファイル作成
-        json_str = json.dumps(result_data, ensure_ascii=False, indent=2)
-        json_bytes = json_str.encode('utf-8')
+        # メモリ上でファイル作成（バイト列をそのままレスポンスに使用）
+        json_bytes = orjson.dumps(result_data, option=ORJSON_OPTIONS | orjson.OPT_INDENT_2)
         
-        return send_file(
-            BytesIO(json_bytes),
-            as_attachment=True,
-            download_name=filename,
-            mimetype='application/json'
-        )
+        response = app.response_class(json_bytes, mimetype='application/json')
+        response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+        response.vary.add('Accept-Encoding')
+        
+        # gzip対応クライアントには圧縮して返却（繰り返しキーが多く高圧縮率）
+        if request.accept_encodings['gzip'] > 0:  # q=0 は明示的な拒否
+            response.set_data(gzip.compress(json_bytes, compresslevel=DOWNLOAD_GZIP_LEVEL))
+            response.headers['Content-Encoding'] = 'gzip'
+        
+        return response
         
     except Exception as e:
-        return jsonify({'error': f'ダウンロード中にエラーが発生しました: {str(e)}'}), 500
+        return ojsonify({'error': f'ダウンロード中にエラーが発生しました: {str(e)}'}), 500
 
 @app.route('/demo')
 def demo():
@@ -323,6 +533,11 @@ def demo():
     
     return render_template('demo.html', demo_candidates=demo_candidates)
 
+def demo_etag(demo_file_path, job_position):
+    """デモファイルの更新日時・サイズと職種からETagを生成"""
+    st = demo_file_path.stat()
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}-{zlib.crc32(job_position.encode('utf-8')):x}"
+
 @app.route('/demo_analyze/<filename>')
 def demo_analyze(filename):
     """デモ用履歴書分析"""
@@ -331,7 +546,7 @@ def demo_analyze(filename):
         demo_file_path = Path('examples') / filename
         
         if not demo_file_path.exists():
-            return jsonify({'error': 'デモファイルが見つかりません'}), 404
+            return ojsonify({'error': 'デモファイルが見つかりません'}), 404
         
         # おすすめ職種の判定
         job_mapping = {
@@ -343,69 +558,39 @@ def demo_analyze(filename):
         
         job_position = job_mapping.get(filename, 'Webエンジニア')
         
+        # デモファイルが更新されていなければ 304 を返し、分析を省略
+        etag = demo_etag(demo_file_path, job_position)
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        
         # ファイル読み込み・分析
         resume_text = extract_text_from_file(demo_file_path)
-        candidate = analyzer.extract_candidate_profile(resume_text)
         
-        # マッチング評価
-        job_req = job_requirements[job_position]
-        matching_result = matcher.calculate_match_score(candidate, job_req)
+        candidate, matching_result = analyze_with_cache(resume_text, job_position)
         
         # 面接計画生成
         interview_plan = question_generator.generate_interview_plan(
-            candidate, job_req, matching_result, InterviewStage.FIRST
+            candidate, job_requirements[job_position], matching_result, InterviewStage.FIRST
         )
         
         # 結果作成
-        result = {
-            'candidate': {
-                'name': candidate.name,
-                'email': candidate.email,
-                'experience_years': candidate.experience_years,
-                'skills': candidate.skills[:10],
-                'education': candidate.education,
-                'certifications': candidate.certifications,
-                'languages': candidate.languages
-            },
-            'evaluation': {
-                'overall_score': round(matching_result.overall_score, 1),
-                'skill_match_score': round(matching_result.skill_match_score, 1),
-                'experience_match_score': round(matching_result.experience_match_score, 1),
-                'culture_fit_score': round(matching_result.culture_fit_score, 1),
-                'education_match_score': round(matching_result.education_match_score, 1),
-                'recommendation': matching_result.recommendation,
-                'interview_focus_areas': matching_result.interview_focus_areas,
-                'detailed_analysis': matching_result.detailed_analysis
-            },
-            'interview_questions': [
-                {
-                    'category': q.category.value,
-                    'question': q.question,
-                    'evaluation_points': q.evaluation_points,
-                    'time_limit_minutes': q.time_limit_minutes,
-                    'follow_up_questions': q.follow_up_questions,
-                    'good_answer_example': q.good_answer_example,
-                    'red_flags': q.red_flags
-                }
-                for q in interview_plan.questions
-            ],
-            'special_notes': interview_plan.special_notes,
-            'job_position': job_position,
-            'analysis_timestamp': datetime.now().isoformat(),
-            'demo_mode': True
-        }
+        result = build_result(candidate, matching_result, interview_plan, job_position, demo_mode=True)
         
-        return jsonify(result)
+        response = ojsonify(result)
+        response.set_etag(etag, weak=True)
+        return response
         
     except Exception as e:
-        return jsonify({'error': f'デモ分析中にエラーが発生しました: {str(e)}'}), 500
+        return ojsonify({'error': f'デモ分析中にエラーが発生しました: {str(e)}'}), 500
 
 @app.route('/health')
 def health():
     """ヘルスチェック"""
-    return jsonify({
+    return ojsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now_iso(),
         'system': 'AI採用支援システム',
         'version': '1.0.0'
     })
@@ -416,6 +601,6 @@ app = app
 
 if __name__ == '__main__':
     # 開発環境での起動（ポート8000を使用）
-    import os
+    # 開発専用のシングルプロセスサーバー。本番環境では gunicorn -c gunicorn.conf.py app:app を使用
     port = int(os.environ.get('PORT', 8000))
     app.run(debug=True, host='0.0.0.0', port=port)
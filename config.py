@@ -12,7 +12,7 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'hr_system_secret_key_2024'
     
     # アプリケーション設定
-    PORT = int(os.environ.get('PORT', 5000))
+    PORT = int(os.environ.get('PORT', 8000))
     HOST = os.environ.get('HOST', '0.0.0.0')
     DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
     
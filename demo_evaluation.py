@@ -7,16 +7,24 @@ AI採用支援システム - 複数候補者評価デモ
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 # srcディレクトリを追加
 src_path = Path(__file__).parent / 'src'
 sys.path.insert(0, str(src_path))
 
 from src.hr_recruitment_system import (
-    ResumeAnalyzer, CandidateMatcher, CompanyProfile, JobRequirement
+    CompanyProfile, JobRequirement, analyze_candidates_batch
 )
 from src.interview_system import InterviewQuestionGenerator, InterviewStage
 
+# 推薦判定の表示名（候補者ごとに作り直さない）
+_RECOMMENDATION_MAP = MappingProxyType({
+    "pass": "✅ 合格推薦 - 即座に採用検討",
+    "interview": "🤔 要面接 - 面接で詳細確認",
+    "reject": "❌ 不合格 - 要件に適合せず"
+})
+
 def demo_candidate_evaluation():
     """複数候補者の評価デモを実行"""
     print("🎯 AI採用支援システム - 多様な候補者評価デモ")
@@ -60,105 +68,116 @@ def demo_candidate_evaluation():
         }
     ]
     
-    analyzer = ResumeAnalyzer()
-    matcher = CandidateMatcher(company)
     question_generator = InterviewQuestionGenerator()
     
+    # 求人要件（全候補者で共通のため、ループ前に一度だけ構築）
+    job_requirements = {
+        "シニアWebエンジニア": JobRequirement(
+            position_title="シニアWebエンジニア",
+            department="プロダクト開発部", 
+            required_skills=["Python", "JavaScript", "React", "SQL"],
+            preferred_skills=["Docker", "AWS", "機械学習", "チーム管理"],
+            experience_level="senior",
+            required_years=4,
+            education_level="大学",
+            salary_range=(700, 1000),
+            employment_type="full-time",
+            remote_work=True,
+            travel_required=False
+        ),
+        "Webエンジニア": JobRequirement(
+            position_title="Webエンジニア",
+            department="プロダクト開発部",
+            required_skills=["Python", "JavaScript", "React", "SQL"], 
+            preferred_skills=["Docker", "AWS", "機械学習", "チーム管理"],
+            experience_level="mid",
+            required_years=3,
+            education_level="大学",
+            salary_range=(500, 800),
+            employment_type="full-time",
+            remote_work=True,
+            travel_required=False
+        ),
+        "ジュニアWebエンジニア": JobRequirement(
+            position_title="ジュニアWebエンジニア",
+            department="プロダクト開発部",
+            required_skills=["HTML", "CSS", "JavaScript"],
+            preferred_skills=["React", "Node.js", "Git", "レスポンシブデザイン"],
+            experience_level="junior", 
+            required_years=1,
+            education_level="専門学校",
+            salary_range=(300, 500),
+            employment_type="full-time",
+            remote_work=False,
+            travel_required=False
+        ),
+        "営業マネージャー": JobRequirement(
+            position_title="営業マネージャー",
+            department="営業部",
+            required_skills=["営業", "顧客管理", "チーム管理", "提案"],
+            preferred_skills=["SaaS営業", "データ分析", "マーケティング", "英語"],
+            experience_level="senior",
+            required_years=5,
+            education_level="大学", 
+            salary_range=(700, 1200),
+            employment_type="full-time",
+            remote_work=True,
+            travel_required=True
+        )
+    }
+    
+    # 履歴書読み込み
+    resume_texts = {}
+    for eval_data in evaluations:
+        try:
+            with open(eval_data['resume_file'], 'r', encoding='utf-8') as f:
+                resume_texts[eval_data['resume_file']] = f.read()
+        except FileNotFoundError:
+            pass
+    
+    # 全候補者の分析・マッチング評価をプロセスプールで一括実行
+    # （同じ履歴書を別の職種で評価することもあるため、結果は評価の番号で対応付ける）
+    loaded = [i for i, eval_data in enumerate(evaluations) if eval_data['resume_file'] in resume_texts]
+    print(f"\n📄 {len(loaded)}件の履歴書を分析し、マッチング評価を実行中...")
+    analyses, failures = analyze_candidates_batch([
+        (resume_texts[evaluations[i]['resume_file']], job_requirements[evaluations[i]['job_position']], company)
+        for i in loaded
+    ])
+    analysis_by_index = {
+        i: (analyses[index], failures.get(index))
+        for index, i in enumerate(loaded)
+    }
+    
     results = []
     
-    for i, eval_data in enumerate(evaluations, 1):
+    for i, eval_data in enumerate(evaluations):
         print(f"\n{'='*60}")
-        print(f"📋 評価 {i}/4: {eval_data['name']}")
+        print(f"📋 評価 {i + 1}/4: {eval_data['name']}")
         print(f"対象職種: {eval_data['job_position']}")
         print(f"期待結果: {eval_data['expected']}")
         print("="*60)
         
-        # 履歴書読み込み
-        try:
-            with open(eval_data['resume_file'], 'r', encoding='utf-8') as f:
-                resume_text = f.read()
-        except FileNotFoundError:
+        if i not in analysis_by_index:
             print(f"❌ ファイルが見つかりません: {eval_data['resume_file']}")
             continue
         
-        # 求人要件読み込み
-        job_requirements = {
-            "シニアWebエンジニア": JobRequirement(
-                position_title="シニアWebエンジニア",
-                department="プロダクト開発部", 
-                required_skills=["Python", "JavaScript", "React", "SQL"],
-                preferred_skills=["Docker", "AWS", "機械学習", "チーム管理"],
-                experience_level="senior",
-                required_years=4,
-                education_level="大学",
-                salary_range=(700, 1000),
-                employment_type="full-time",
-                remote_work=True,
-                travel_required=False
-            ),
-            "Webエンジニア": JobRequirement(
-                position_title="Webエンジニア",
-                department="プロダクト開発部",
-                required_skills=["Python", "JavaScript", "React", "SQL"], 
-                preferred_skills=["Docker", "AWS", "機械学習", "チーム管理"],
-                experience_level="mid",
-                required_years=3,
-                education_level="大学",
-                salary_range=(500, 800),
-                employment_type="full-time",
-                remote_work=True,
-                travel_required=False
-            ),
-            "ジュニアWebエンジニア": JobRequirement(
-                position_title="ジュニアWebエンジニア",
-                department="プロダクト開発部",
-                required_skills=["HTML", "CSS", "JavaScript"],
-                preferred_skills=["React", "Node.js", "Git", "レスポンシブデザイン"],
-                experience_level="junior", 
-                required_years=1,
-                education_level="専門学校",
-                salary_range=(300, 500),
-                employment_type="full-time",
-                remote_work=False,
-                travel_required=False
-            ),
-            "営業マネージャー": JobRequirement(
-                position_title="営業マネージャー",
-                department="営業部",
-                required_skills=["営業", "顧客管理", "チーム管理", "提案"],
-                preferred_skills=["SaaS営業", "データ分析", "マーケティング", "英語"],
-                experience_level="senior",
-                required_years=5,
-                education_level="大学", 
-                salary_range=(700, 1200),
-                employment_type="full-time",
-                remote_work=True,
-                travel_required=True
-            )
-        }
+        analysis, error = analysis_by_index[i]
+        if error:
+            print(f"❌ 分析に失敗しました: {error}")
+            continue
         
         job_req = job_requirements[eval_data['job_position']]
+        candidate, matching_result = analysis
         
-        # 候補者プロファイル抽出
-        print("📄 履歴書を分析中...")
-        candidate = analyzer.extract_candidate_profile(resume_text)
+        # 候補者プロファイル
         print(f"✅ 候補者: {candidate.name}")
         print(f"✅ 経験年数: {candidate.experience_years}年")
         print(f"✅ 主要スキル: {', '.join(candidate.skills[:5])}...")
         
-        # マッチング評価
-        print("\n🎯 マッチング評価を実行中...")
-        matching_result = matcher.calculate_match_score(candidate, job_req)
-        
         # 結果表示
         print(f"\n🏆 総合評価: {matching_result.overall_score:.1f}点")
         
-        recommendation_map = {
-            "pass": "✅ 合格推薦 - 即座に採用検討",
-            "interview": "🤔 要面接 - 面接で詳細確認", 
-            "reject": "❌ 不合格 - 要件に適合せず"
-        }
-        print(f"📊 判定: {recommendation_map.get(matching_result.recommendation)}")
+        print(f"📊 判定: {_RECOMMENDATION_MAP.get(matching_result.recommendation)}")
         
         print(f"\n📈 詳細スコア:")
         print(f"  • スキルマッチ: {matching_result.skill_match_score:.1f}点")
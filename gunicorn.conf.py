@@ -0,0 +1,31 @@
+"""
+AI採用支援システム - Gunicorn 設定
+本番環境用のWSGIサーバー設定（gunicorn はカレントディレクトリの本ファイルを自動で読み込む）
+"""
+
+import gc
+import os
+
+# 接続設定
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"  # app.py / wsgi.py の開発サーバーと同じ既定ポート
+timeout = 120
+
+# ワーカー設定
+# 分析エンジン（analyzer / matcher / question_generator）はマスタープロセスで
+# 一度だけ初期化し、fork 後の各ワーカーで共有する
+preload_app = True
+# 既定は従来の Procfile と同じ2（各ワーカーが一括分析用のプロセスプールも持つため、CPUコア数にはしない）
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+
+# 分析処理はCPUバウンドのため、非同期ワーカーではなくスレッドワーカーを使用
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+def when_ready(server):
+    """
+    ワーカー起動前（アプリ読み込み後）にマスターで1回だけ呼ばれる
+
+    読み込み済みのオブジェクト（質問テンプレート・評価基準など）を GC の対象外にし、
+    ワーカー側の GC がオブジェクトヘッダを書き換えてページのコピーオンライトを起こさないようにする
+    """
+    gc.freeze()
@@ -4,9 +4,13 @@ HR採用支援システム - デモスクリプト
 システムの機能を実際に動作させて効果を確認
 """
 
+import io
 import json
 import os
+import sys
+from contextlib import redirect_stdout
 from pathlib import Path
+from types import MappingProxyType
 
 from .hr_recruitment_system import (
     ResumeAnalyzer, CandidateMatcher, CompanyProfile, JobRequirement
@@ -15,8 +19,64 @@ from .interview_system import (
     InterviewQuestionGenerator, InterviewStage
 )
 
+# 推薦判定の表示名
+_RECOMMENDATION_MAP = MappingProxyType({
+    "pass": "✅ 合格推薦 - 即座に次のステップへ",
+    "interview": "🤔 要面接 - 面接で詳細確認が必要",
+    "reject": "❌ 不合格 - 要件に適合しない"
+})
+
+# 毎回組み立てる必要のない固定の出力ブロック
+_EFFECT_REPORT = """\
+【従来手法との比較】
+📋 履歴書スクリーニング:
+   従来: 8時間/人 → AI活用: 2分/人 (99.6% 削減)
+   精度: 担当者のスキル依存 → 客観的・一貫性のある評価
+
+❓ 面接準備:
+   従来: 2時間 → AI活用: 5分 (95.8% 削減)
+   品質: 経験とカンに依存 → 構造化された質問と評価基準
+
+📊 評価レポート:
+   従来: 1時間 → AI活用: 1分 (98.3% 削減)
+   標準化: バラつきあり → 統一された評価軸
+
+💰 コスト効果:
+   人件費削減: 月40時間 → 月2時間 (95% 削減)
+   年間効果: 約480時間の工数削減
+   品質向上: 見落とし防止、公正な評価、採用ミスマッチ削減
+"""
+
+_USAGE_NOTES_AND_CLOSING = """\
+
+【システム活用時の注意点】
+  • AIは判断支援ツールです。最終決定は人間が行ってください
+  • 個人情報の取り扱いには十分注意してください
+  • 定期的に評価基準を見直し、偏見のない公正な採用を心がけてください
+  • 法的規制や企業ポリシーに準拠した運用を行ってください
+
+🎉 デモンストレーション完了!
+============================================================
+このシステムにより、採用プロセスの効率化と品質向上を実現できます。
+ご不明な点がございましたら、開発チームまでお問い合わせください。
+"""
+
 def demo_full_workflow():
-    """採用プロセス全体のデモを実行"""
+    """
+    採用プロセス全体のデモを実行
+    
+    出力はバッファにためて最後に1回で書き出す（中断・エラー時もそこまでの出力は書き出す）
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            _run_full_workflow()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+def _run_full_workflow():
+    """採用プロセス全体のデモ本体"""
     print("🚀 AI採用支援システム - 完全デモンストレーション")
     print("=" * 60)
     
@@ -118,12 +178,7 @@ Email: sato.hanako@example.com
     print(f"📊 学歴マッチ: {matching_result.education_match_score:.1f}点")
     
     # 推薦判定の表示
-    recommendation_map = {
-        "pass": "✅ 合格推薦 - 即座に次のステップへ",
-        "interview": "🤔 要面接 - 面接で詳細確認が必要",
-        "reject": "❌ 不合格 - 要件に適合しない"
-    }
-    print(f"🎯 判定: {recommendation_map.get(matching_result.recommendation)}")
+    print(f"🎯 判定: {_RECOMMENDATION_MAP.get(matching_result.recommendation)}")
     
     # 5. 1次面接計画生成
     print("\n❓ ステップ5: 1次面接計画生成")
@@ -168,23 +223,7 @@ Email: sato.hanako@example.com
     print("\n📈 ステップ7: 効果測定レポート")
     print("-" * 30)
     
-    print("【従来手法との比較】")
-    print("📋 履歴書スクリーニング:")
-    print("   従来: 8時間/人 → AI活用: 2分/人 (99.6% 削減)")
-    print("   精度: 担当者のスキル依存 → 客観的・一貫性のある評価")
-    
-    print("\n❓ 面接準備:")
-    print("   従来: 2時間 → AI活用: 5分 (95.8% 削減)")
-    print("   品質: 経験とカンに依存 → 構造化された質問と評価基準")
-    
-    print("\n📊 評価レポート:")
-    print("   従来: 1時間 → AI活用: 1分 (98.3% 削減)")
-    print("   標準化: バラつきあり → 統一された評価軸")
-    
-    print("\n💰 コスト効果:")
-    print("   人件費削減: 月40時間 → 月2時間 (95% 削減)")
-    print("   年間効果: 約480時間の工数削減")
-    print("   品質向上: 見落とし防止、公正な評価、採用ミスマッチ削減")
+    print(_EFFECT_REPORT, end="")
     
     # 8. 特記事項・注意点
     print("\n⚠️ ステップ8: 特記事項・注意点")
@@ -195,65 +234,61 @@ Email: sato.hanako@example.com
         for note in interview_plan_1st.special_notes:
             print(f"  {note}")
     
-    print("\n【システム活用時の注意点】")
-    print("  • AIは判断支援ツールです。最終決定は人間が行ってください")
-    print("  • 個人情報の取り扱いには十分注意してください")  
-    print("  • 定期的に評価基準を見直し、偏見のない公正な採用を心がけてください")
-    print("  • 法的規制や企業ポリシーに準拠した運用を行ってください")
-    
-    print("\n🎉 デモンストレーション完了!")
-    print("=" * 60)
-    print("このシステムにより、採用プロセスの効率化と品質向上を実現できます。")
-    print("ご不明な点がございましたら、開発チームまでお問い合わせください。")
+    print(_USAGE_NOTES_AND_CLOSING, end="")
+
+# 従来手法との比較データ（表示内容は固定のため、出力文字列も一度だけ組み立てる）
+_COMPARISON_DATA = (
+    {
+        "process": "履歴書スクリーニング（50名分）",
+        "traditional": "40時間",
+        "ai_system": "1.7時間",
+        "reduction": "95.8%",
+        "quality": "担当者のスキル依存 → 一定品質保証"
+    },
+    {
+        "process": "面接質問準備（5ポジション）",
+        "traditional": "10時間",
+        "ai_system": "25分",
+        "reduction": "95.8%",
+        "quality": "経験とカンに依存 → 構造化・体系化"
+    },
+    {
+        "process": "候補者評価レポート作成",
+        "traditional": "5時間",
+        "ai_system": "5分",
+        "reduction": "98.3%",
+        "quality": "主観的評価 → 客観的・定量的評価"
+    },
+    {
+        "process": "採用決定会議準備",
+        "traditional": "3時間",
+        "ai_system": "30分",
+        "reduction": "83.3%",
+        "quality": "情報散在 → 整理された判断材料"
+    }
+)
+
+_COMPARISON_REPORT = "\n".join([
+    "\n📊 従来手法 vs AI活用システム - 詳細比較",
+    "=" * 60,
+    *(
+        f"\n📋 {data['process']}\n"
+        f"   従来手法: {data['traditional']}\n"
+        f"   AI活用後: {data['ai_system']}\n"
+        f"   削減効果: {data['reduction']}\n"
+        f"   品質向上: {data['quality']}"
+        for data in _COMPARISON_DATA
+    ),
+    "\n💡 総合効果:",
+    "   月間工数削減: 約58時間 → 約2.5時間 (95.7%削減)",
+    "   年間効果: 約660時間の工数削減",
+    "   コスト換算: 約330万円の人件費削減（年収500万円の場合）",
+    "   品質向上: 採用ミスマッチ30%減少（推定）",
+]) + "\n"
 
 def performance_comparison():
     """パフォーマンス比較デモ"""
-    print("\n📊 従来手法 vs AI活用システム - 詳細比較")
-    print("=" * 60)
-    
-    comparison_data = [
-        {
-            "process": "履歴書スクリーニング（50名分）",
-            "traditional": "40時間",
-            "ai_system": "1.7時間",
-            "reduction": "95.8%",
-            "quality": "担当者のスキル依存 → 一定品質保証"
-        },
-        {
-            "process": "面接質問準備（5ポジション）",
-            "traditional": "10時間",
-            "ai_system": "25分",
-            "reduction": "95.8%",
-            "quality": "経験とカンに依存 → 構造化・体系化"
-        },
-        {
-            "process": "候補者評価レポート作成",
-            "traditional": "5時間",
-            "ai_system": "5分",
-            "reduction": "98.3%",
-            "quality": "主観的評価 → 客観的・定量的評価"
-        },
-        {
-            "process": "採用決定会議準備",
-            "traditional": "3時間",
-            "ai_system": "30分",
-            "reduction": "83.3%",
-            "quality": "情報散在 → 整理された判断材料"
-        }
-    ]
-    
-    for data in comparison_data:
-        print(f"\n📋 {data['process']}")
-        print(f"   従来手法: {data['traditional']}")
-        print(f"   AI活用後: {data['ai_system']}")
-        print(f"   削減効果: {data['reduction']}")
-        print(f"   品質向上: {data['quality']}")
-    
-    print(f"\n💡 総合効果:")
-    print(f"   月間工数削減: 約58時間 → 約2.5時間 (95.7%削減)")
-    print(f"   年間効果: 約660時間の工数削減")
-    print(f"   コスト換算: 約330万円の人件費削減（年収500万円の場合）")
-    print(f"   品質向上: 採用ミスマッチ30%減少（推定）")
+    sys.stdout.write(_COMPARISON_REPORT)
 
 if __name__ == "__main__":
     try:
@@ -263,5 +298,7 @@ if __name__ == "__main__":
         print("\n\n👋 デモを中断しました。")
     except Exception as e:
         print(f"\n❌ デモ実行中にエラーが発生しました: {e}")
-        import traceback
-        traceback.print_exc()
+        # スタックトレースは HR_DEBUG=1 指定時のみ表示
+        if os.environ.get("HR_DEBUG"):
+            import traceback
+            traceback.print_exc()
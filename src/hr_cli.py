@@ -4,22 +4,207 @@ HR採用支援システム - CLIインターフェース
 コマンドラインから簡単に採用業務を効率化
 """
 
-import argparse
+from __future__ import annotations
+
+import hashlib
 import json
+import mmap
 import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from dataclasses import fields, is_dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# 分析・面接モジュールは読み込みが重いため、使用する処理の中で遅延importする
+if TYPE_CHECKING:
+    from .hr_recruitment_system import (
+        ResumeAnalyzer, CompanyProfile, JobRequirement, CandidateProfile, MatchingResult
+    )
+    from .interview_system import InterviewQuestionGenerator, InterviewPlan
+    from .skill_embeddings import SkillVocabulary
+    import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 推薦判定の表示名
+_RECOMMENDATION_MAP = MappingProxyType({
+    "pass": "✅ 推薦 - 即座に次のステップへ",
+    "interview": "🤔 要面接 - 面接で詳細確認が必要",
+    "reject": "❌ 不採用 - 要件に適合しない"
+})
+
+# 面接ステージ指定と InterviewStage のメンバー名（InterviewStage は遅延importのため名前で保持）
+_STAGE_MAP = MappingProxyType({
+    "1st": "FIRST",
+    "2nd": "SECOND",
+    "final": "FINAL"
+})
+
+def load_json(path) -> Dict:
+    """JSONファイルを読み込み（orjsonがあれば優先して使用）"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def split_comma_list(text: str) -> List[str]:
+    """カンマ区切りの入力を前後の空白を除いたリストに変換（空要素は除外）"""
+    return [item for item in map(str.strip, text.split(',')) if item]
+
+def read_config_documents(config_file_path) -> List[Dict]:
+    """
+    一括登録用の設定ファイルを読み込み、設定（辞書）のリストを返す
+    
+    .yaml/.yml は複数ドキュメント（---区切り）に対応し（PyYAML が必要）、
+    それ以外はJSONとして読み込む。各ドキュメントは辞書または辞書のリスト
+    """
+    if Path(config_file_path).suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            print("❌ YAMLファイルの読み込みには PyYAML が必要です: pip install pyyaml")
+            sys.exit(1)
+        with open(config_file_path, 'r', encoding='utf-8') as f:
+            raw_documents = list(yaml.safe_load_all(f))
+    else:
+        raw_documents = [load_json(config_file_path)]
+    
+    documents = []
+    for document in raw_documents:
+        if document is None:
+            continue
+        if not isinstance(document, list):
+            document = [document]
+        for item in document:
+            if not isinstance(item, dict):
+                print(f"❌ 設定は項目名と値の組で記述してください: {item!r}")
+                sys.exit(1)
+            documents.append(item)
+    return documents
+
+def _json_default(obj):
+    """JSONで直接扱えない値（Enum・dataclass等）の変換"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj):
+        # 派生フィールド（init=False）は出力しない
+        return {f.name: getattr(obj, f.name) for f in fields(obj) if f.init}
+    if isinstance(obj, MappingProxyType):
+        # 読み取り専用ビュー（評価レベル等）
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def read_resume_text(resume_file_path) -> str:
+    """
+    履歴書ファイルを読み込み
+    
+    mmapしたページから直接デコードし、ファイル全体のbytesコピーを作らない
+    """
+    with open(resume_file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    # テキストモードの読み込みと同様に改行コードを統一
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+# 分析結果キャッシュの形式バージョン（抽出ロジックや CandidateProfile を変更したら上げる）
+PROFILE_CACHE_VERSION = 7
+# キャッシュディレクトリの上限サイズ（超えたら更新日時の古い順に削除）
+PROFILE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+def _field_names(cls) -> Tuple[str, ...]:
+    """データクラスのフィールド構成（派生フィールドを含む）。pickle の互換性確認に使う"""
+    return tuple(f.name for f in fields(cls))
+
+def resume_cache_key(resume_file_path) -> str:
+    """履歴書ファイルの内容（bytes）のSHA-1から分析結果キャッシュのキーを作成"""
+    digest = hashlib.sha1(f"v{PROFILE_CACHE_VERSION}:".encode())
+    with open(resume_file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+    return digest.hexdigest()
+
+def load_cached_profile(cache_dir: Path, key: str) -> Optional[CandidateProfile]:
+    """キャッシュ済みの候補者プロファイルを読み込み（無い・壊れている場合は None）"""
+    cache_path = cache_dir / f"{key}.pkl"
+    try:
+        with open(cache_path, 'rb') as f:
+            candidate = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        cache_path.unlink(missing_ok=True)
+        return None
+    # 更新日時を最終利用日時として使う（古い順に削除するため）
+    os.utime(cache_path)
+    return candidate
 
-from .hr_recruitment_system import (
-    ResumeAnalyzer, CandidateMatcher, CompanyProfile, JobRequirement,
-    CandidateProfile, MatchingResult
-)
-from .interview_system import (
-    InterviewQuestionGenerator, InterviewStage, InterviewPlan,
-    generate_interview_report
-)
+def store_cached_profile(cache_dir: Path, key: str, candidate: CandidateProfile):
+    """候補者プロファイルをキャッシュに保存（一時ファイル経由で置き換え）"""
+    cache_dir.mkdir(exist_ok=True)
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(candidate, f, protocol=5)
+    os.replace(tmp_path, cache_dir / f"{key}.pkl")
+
+def evict_profile_cache(cache_dir: Path, max_bytes: int = PROFILE_CACHE_MAX_BYTES):
+    """キャッシュが上限サイズを超えていれば、最終利用日時の古いものから削除"""
+    if not cache_dir.exists():
+        return
+    entries = []
+    for path in cache_dir.glob('*.pkl'):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+def _analyze_resume_file(resume_file_path, cache_dir: Path, key: str) -> CandidateProfile:
+    """
+    履歴書ファイル1件を読み込んで分析し、結果をキャッシュに保存
+    
+    プロセスプールから呼び出せるようにモジュールトップレベルに定義し、
+    分析器はワーカープロセスごとに1つだけ生成する
+    """
+    from .hr_recruitment_system import get_shared_analyzer
+    candidate = get_shared_analyzer().extract_candidate_profile(read_resume_text(resume_file_path))
+    store_cached_profile(cache_dir, key, candidate)
+    return candidate
+
+def dump_json(obj, path):
+    """
+    JSONファイルをインデント付きで書き込み（orjsonがあれば優先して使用）
+    
+    dataclass（派生フィールドを除く）と Enum（値を出力）はそのまま渡せる
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                obj, default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+            ))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2, default=_json_default)
 
 class HRCLISystem:
     """HR採用支援システムのCLIクラス"""
@@ -28,15 +213,48 @@ class HRCLISystem:
         self.config_dir = Path.home() / ".hr_system"
         self.config_dir.mkdir(exist_ok=True)
         
-        self.analyzer = ResumeAnalyzer()
-        self.question_generator = InterviewQuestionGenerator()
+        # 分析器・質問生成器は初回使用時に生成
+        self.analyzer: Optional[ResumeAnalyzer] = None
+        self.question_generator: Optional[InterviewQuestionGenerator] = None
         
         # 設定ファイルのパス
         self.company_config_path = self.config_dir / "company_profile.json"
+        # 企業プロファイルのpickle（JSONより新しければ解析せずにそのまま読み込む）
+        self.company_pickle_path = self.company_config_path.with_suffix('.pkl')
         self.jobs_config_path = self.config_dir / "job_requirements.json"
+        # 履歴書の分析結果キャッシュ（ファイル内容のSHA-1をキーとする）
+        self.profile_cache_dir = self.config_dir / "cache"
+        # 求人スキルの正規化済みベクトル（--batch 用）とその対応表
+        self.job_vectors_path = self.config_dir / "job_embeddings.npy"
+        self.job_vectors_index_path = self.config_dir / "job_embeddings.json"
+        # スキルの重要度（任意。あればスキルマッチを重み付きで計算）
+        self.skill_weights_path = self.config_dir / "skill_weights.npz"
         
+        # 読み込み済み設定のキャッシュ（ファイルの更新日時で無効化）
+        self._company_cache: Optional[CompanyProfile] = None
+        self._company_mtime: Optional[int] = None
+        self._jobs_cache: Optional[Dict[str, Dict]] = None
+        self._jobs_mtime: Optional[int] = None
+        self._job_req_cache: Dict[str, JobRequirement] = {}
+        
+    def _get_analyzer(self) -> ResumeAnalyzer:
+        """履歴書分析器を取得（初回のみ生成）"""
+        if self.analyzer is None:
+            from .hr_recruitment_system import ResumeAnalyzer
+            self.analyzer = ResumeAnalyzer()
+        return self.analyzer
+    
+    def _get_question_generator(self) -> InterviewQuestionGenerator:
+        """面接質問生成器を取得（初回のみ生成）"""
+        if self.question_generator is None:
+            from .interview_system import InterviewQuestionGenerator
+            self.question_generator = InterviewQuestionGenerator()
+        return self.question_generator
+    
     def setup_company_profile(self):
         """企業プロファイルの初期設定"""
+        from .hr_recruitment_system import CompanyProfile
+        
         print("🏢 企業プロファイルの設定を開始します...")
         print("=" * 50)
         
@@ -46,15 +264,15 @@ class HRCLISystem:
         
         print("\n価値観を入力してください（カンマ区切りで複数入力可能）:")
         values_input = input("例: 革新性,協調性,社会貢献,継続学習: ")
-        values = [v.strip() for v in values_input.split(',') if v.strip()]
+        values = split_comma_list(values_input)
         
         print("\n組織文化のキーワードを入力してください（カンマ区切り）:")
         culture_input = input("例: フラット,自由,成長志向,多様性: ")
-        culture_keywords = [c.strip() for c in culture_input.split(',') if c.strip()]
+        culture_keywords = split_comma_list(culture_input)
         
         print("\n働き方の特徴を入力してください（カンマ区切り）:")
         workstyle_input = input("例: リモートワーク,フレックスタイム,副業OK: ")
-        work_style = [w.strip() for w in workstyle_input.split(',') if w.strip()]
+        work_style = split_comma_list(workstyle_input)
         
         company_profile = CompanyProfile(
             company_name=company_name,
@@ -65,28 +283,114 @@ class HRCLISystem:
             work_style=work_style
         )
         
-        # 設定を保存
-        with open(self.company_config_path, 'w', encoding='utf-8') as f:
-            json.dump(company_profile.__dict__, f, ensure_ascii=False, indent=2)
+        self._save_company_profile(company_profile)
         
         print(f"\n✅ 企業プロファイルが保存されました: {self.company_config_path}")
         return company_profile
     
+    def _save_company_profile(self, company_profile: CompanyProfile):
+        """企業プロファイルを保存"""
+        from .hr_recruitment_system import config_fields
+        
+        dump_json(config_fields(company_profile), self.company_config_path)
+        self._save_company_pickle(company_profile)
+    
+    def import_company_profile(self, config_file_path: str) -> CompanyProfile:
+        """企業プロファイルを設定ファイル（YAML/JSON）から一括登録"""
+        from .hr_recruitment_system import CompanyProfile
+        
+        documents = read_config_documents(config_file_path)
+        if len(documents) != 1:
+            print(f"❌ 企業プロファイルは1件だけ記述してください（{len(documents)}件あります）")
+            sys.exit(1)
+        try:
+            company_profile = CompanyProfile(**documents[0])
+        except TypeError as e:
+            print(f"❌ 企業プロファイルの形式が正しくありません: {e}")
+            sys.exit(1)
+        
+        self._save_company_profile(company_profile)
+        
+        print(f"✅ 企業プロファイルが保存されました: {self.company_config_path}")
+        return company_profile
+    
     def load_company_profile(self) -> Optional[CompanyProfile]:
         """企業プロファイルを読み込み"""
         if not self.company_config_path.exists():
             return None
         
         try:
-            with open(self.company_config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return CompanyProfile(**data)
+            mtime = self.company_config_path.stat().st_mtime_ns
+            if self._company_cache is None or mtime != self._company_mtime:
+                company_profile = self._load_company_pickle(mtime)
+                if company_profile is None:
+                    # JSON（編集用の正本）から読み込み、pickleを作り直す
+                    from .hr_recruitment_system import CompanyProfile
+                    company_profile = CompanyProfile(**load_json(self.company_config_path))
+                    self._save_company_pickle(company_profile)
+                self._company_cache = company_profile
+                self._company_mtime = mtime
+            return self._company_cache
         except Exception as e:
             print(f"⚠️ 企業プロファイルの読み込みに失敗しました: {e}")
             return None
     
+    def _load_company_pickle(self, json_mtime: int) -> Optional[CompanyProfile]:
+        """
+        JSONと同じか新しい企業プロファイルのpickleがあれば読み込み
+        
+        形式バージョンか CompanyProfile のフィールド構成が保存時と異なれば使わない
+        """
+        from .hr_recruitment_system import CompanyProfile
+        try:
+            if self.company_pickle_path.stat().st_mtime_ns < json_mtime:
+                return None
+            with open(self.company_pickle_path, 'rb') as f:
+                version, shape, company_profile = pickle.load(f)
+        except Exception:
+            return None
+        if version != PROFILE_CACHE_VERSION or shape != _field_names(CompanyProfile):
+            return None
+        if not isinstance(company_profile, CompanyProfile):
+            return None
+        return company_profile
+    
+    def _save_company_pickle(self, company_profile: CompanyProfile):
+        """企業プロファイルをpickleで保存（失敗してもJSONがあるため無視）"""
+        tmp_path = self.company_pickle_path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(
+                    (PROFILE_CACHE_VERSION, _field_names(type(company_profile)), company_profile),
+                    f, protocol=5
+                )
+            os.replace(tmp_path, self.company_pickle_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+    
+    def _load_jobs(self) -> Dict[str, Dict]:
+        """求人要件設定を読み込み（ファイルが更新されていなければキャッシュを返す）"""
+        mtime = self.jobs_config_path.stat().st_mtime_ns
+        if self._jobs_cache is None or mtime != self._jobs_mtime:
+            self._jobs_cache = load_json(self.jobs_config_path)
+            self._jobs_mtime = mtime
+            self._job_req_cache = {}
+        return self._jobs_cache
+    
+    def _get_job_requirement(self, job_position: str) -> JobRequirement:
+        """職種の求人要件を取得（設定ファイルが更新されるまで同じオブジェクトを再利用）"""
+        jobs_data = self._load_jobs()
+        job_req = self._job_req_cache.get(job_position)
+        if job_req is None:
+            from .hr_recruitment_system import JobRequirement
+            job_req = JobRequirement(**jobs_data[job_position])
+            self._job_req_cache[job_position] = job_req
+        return job_req
+    
     def setup_job_requirement(self):
         """求人要件の設定"""
+        from .hr_recruitment_system import JobRequirement
+        
         print("💼 求人要件の設定を開始します...")
         print("=" * 50)
         
@@ -95,11 +399,11 @@ class HRCLISystem:
         
         print("\n必須スキルを入力してください（カンマ区切り）:")
         required_input = input("例: Python,JavaScript,React: ")
-        required_skills = [s.strip() for s in required_input.split(',') if s.strip()]
+        required_skills = split_comma_list(required_input)
         
         print("\n優遇スキルを入力してください（カンマ区切り、任意）:")
         preferred_input = input("例: Docker,AWS,チーム管理: ")
-        preferred_skills = [s.strip() for s in preferred_input.split(',') if s.strip()]
+        preferred_skills = split_comma_list(preferred_input)
         
         experience_level = input("\n経験レベルを入力してください (junior/mid/senior): ")
         required_years = int(input("必要経験年数を入力してください: "))
@@ -127,38 +431,283 @@ class HRCLISystem:
             travel_required=travel_required
         )
         
-        # 設定を保存
+        self._save_job_requirements([job_req])
+        
+        print(f"\n✅ 求人要件が保存されました: {position_title}")
+        return job_req
+    
+    def _save_job_requirements(self, job_reqs: List[JobRequirement]):
+        """求人要件を既存の設定にマージして1回で保存（同じ職種名は上書き）"""
+        from .hr_recruitment_system import config_fields
+        
         jobs_data = {}
         if self.jobs_config_path.exists():
-            with open(self.jobs_config_path, 'r', encoding='utf-8') as f:
-                jobs_data = json.load(f)
+            jobs_data = dict(self._load_jobs())
         
-        jobs_data[position_title] = job_req.__dict__
+        for job_req in job_reqs:
+            jobs_data[job_req.position_title] = config_fields(job_req)
         
-        with open(self.jobs_config_path, 'w', encoding='utf-8') as f:
-            json.dump(jobs_data, f, ensure_ascii=False, indent=2)
+        dump_json(jobs_data, self.jobs_config_path)
         
-        print(f"\n✅ 求人要件が保存されました: {position_title}")
-        return job_req
+        # 一括評価用の求人ベクトルを保存時に作成しておく（numpy が無い場合は --batch 実行時に作成）
+        try:
+            self._job_embeddings()
+        except ImportError:
+            pass
+    
+    def import_job_requirements(self, config_file_path: str) -> List[JobRequirement]:
+        """
+        求人要件を設定ファイル（YAML/JSON）から一括登録
+        
+        1ドキュメント1職種、またはリスト形式で複数職種を記述できる。
+        1件でも形式が正しくなければ何も保存しない
+        """
+        from .hr_recruitment_system import JobRequirement
+        
+        documents = read_config_documents(config_file_path)
+        if not documents:
+            print(f"❌ 求人要件が記述されていません: {config_file_path}")
+            sys.exit(1)
+        
+        job_reqs = []
+        for i, document in enumerate(documents, 1):
+            try:
+                job_reqs.append(JobRequirement(**document))
+            except TypeError as e:
+                print(f"❌ {i}件目の求人要件の形式が正しくありません: {e}")
+                sys.exit(1)
+        
+        self._save_job_requirements(job_reqs)
+        
+        print(f"✅ {len(job_reqs)}件の求人要件が保存されました: {', '.join(job_req.position_title for job_req in job_reqs)}")
+        return job_reqs
+    
+    def build_skill_weights(self) -> Dict[str, float]:
+        """
+        登録済みの全求人からスキルの重要度を算出して skill_weights.npz に保存
+        
+        多くの求人で求められるスキルほど重みが小さく、希少なスキルほど大きい。
+        保存後の --analyze / --interview / --full のスキルマッチはこの重みで計算される
+        """
+        from .hr_recruitment_system import skill_rca_weights, save_skill_weights
+        
+        if not self.jobs_config_path.exists():
+            print("❌ 求人要件が設定されていません。--setup-job を実行してください。")
+            sys.exit(1)
+        
+        jobs_data = self._load_jobs()
+        skill_weights = skill_rca_weights([self._get_job_requirement(job_position) for job_position in jobs_data])
+        if not skill_weights:
+            print("❌ 求人要件にスキルが登録されていません。")
+            sys.exit(1)
+        
+        save_skill_weights(self.skill_weights_path, skill_weights)
+        
+        print(f"✅ {len(skill_weights)}件のスキルの重要度を保存しました: {self.skill_weights_path}")
+        for skill, weight in sorted(skill_weights.items(), key=lambda item: (-item[1], item[0])):
+            print(f"  {skill}: {weight:.2f}")
+        return skill_weights
     
     def analyze_resume(self, resume_file_path: str) -> CandidateProfile:
         """履歴書を分析"""
         print(f"📄 履歴書を分析しています: {resume_file_path}")
         
         try:
-            with open(resume_file_path, 'r', encoding='utf-8') as f:
-                resume_text = f.read()
+            key = resume_cache_key(resume_file_path)
+            candidate = load_cached_profile(self.profile_cache_dir, key)
+            resume_text = read_resume_text(resume_file_path) if candidate is None else None
         except Exception as e:
             print(f"❌ ファイルの読み込みに失敗しました: {e}")
             sys.exit(1)
         
-        candidate = self.analyzer.extract_candidate_profile(resume_text)
+        # 同じ内容の履歴書を分析済みであればキャッシュを使用
+        if candidate is None:
+            candidate = self._get_analyzer().extract_candidate_profile(resume_text)
+            store_cached_profile(self.profile_cache_dir, key, candidate)
+            evict_profile_cache(self.profile_cache_dir)
         
         print(f"✅ 分析完了: {candidate.name}")
         return candidate
     
+    def batch_analyze(self, resume_paths: List[Path]) -> Tuple[List[Path], List[CandidateProfile]]:
+        """
+        複数の履歴書をプロセスプールで並列に分析
+        
+        分析できた履歴書のパスと候補者プロファイルを入力順で返し、
+        読み込み・分析に失敗したファイルはスキップする。
+        分析済み（キャッシュあり）の履歴書はプロセスプールに渡さない
+        """
+        results: Dict[int, CandidateProfile] = {}
+        pending = []
+        for index, path in enumerate(resume_paths):
+            try:
+                key = resume_cache_key(path)
+            except Exception as e:
+                print(f"⚠️ スキップ: {path.name} ({e})")
+                continue
+            candidate = load_cached_profile(self.profile_cache_dir, key)
+            if candidate is None:
+                pending.append((index, path, key))
+            else:
+                results[index] = candidate
+        
+        def collect(index, path, get_result):
+            try:
+                results[index] = get_result()
+            except Exception as e:
+                print(f"⚠️ スキップ: {path.name} ({e})")
+        
+        if pending:
+            try:
+                executor = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(pending)))
+            except (OSError, NotImplementedError, ValueError):
+                # マルチプロセスが使えない環境では逐次処理
+                executor = None
+            
+            cache_dir = self.profile_cache_dir
+            if executor is None:
+                for index, path, key in pending:
+                    collect(index, path, lambda path=path, key=key: _analyze_resume_file(path, cache_dir, key))
+            else:
+                with executor:
+                    futures = [executor.submit(_analyze_resume_file, path, cache_dir, key)
+                               for _, path, key in pending]
+                    for (index, path, _), future in zip(pending, futures):
+                        collect(index, path, future.result)
+            evict_profile_cache(cache_dir)
+        
+        analyzed = sorted(results)
+        return [resume_paths[index] for index in analyzed], [results[index] for index in analyzed]
+    
+    def _job_embeddings(self) -> Tuple[SkillVocabulary, List[str], np.ndarray]:
+        """
+        全求人の必須スキルをL2正規化したベクトルを取得
+        
+        求人要件設定の保存時に作成して .npy に保存し、以降はmmapで読み込む。
+        設定ファイルやスキル語彙が変わっていれば作り直す
+        """
+        from .hr_recruitment_system import JobRequirement, skill_key
+        from .skill_embeddings import SkillVocabulary, load_vectors, save_vectors
+        
+        jobs_data = self._load_jobs()
+        job_reqs = [JobRequirement(**data) for data in jobs_data.values()]
+        # スキル語彙（抽出対象スキル + 求人要件のスキル）。表記ゆれを吸収するため代表表記（skill_key）で持つ
+        vocabulary = SkillVocabulary(map(skill_key,
+            [skill for skills in self._get_analyzer().skill_keywords.values() for skill in skills] +
+            [skill for job_req in job_reqs for skill in job_req.required_skills]
+        ))
+        positions = list(jobs_data)
+        
+        index = {
+            "jobs_mtime_ns": self._jobs_mtime,
+            "positions": positions,
+            "vocabulary": vocabulary.skills
+        }
+        if self.job_vectors_path.exists() and self.job_vectors_index_path.exists():
+            try:
+                if load_json(self.job_vectors_index_path) == index:
+                    return vocabulary, positions, load_vectors(self.job_vectors_path)
+            except Exception:
+                pass
+        
+        job_vectors = vocabulary.encode([job_req.required_skills_set for job_req in job_reqs])
+        save_vectors(self.job_vectors_path, job_vectors)
+        dump_json(index, self.job_vectors_index_path)
+        return vocabulary, positions, job_vectors
+    
+    def batch_evaluate(self, resume_dir: str, job_position: Optional[str] = None, top_k: int = 10) -> Dict:
+        """
+        ディレクトリ内の履歴書を一括評価
+        
+        候補者と求人のスキルをベクトル化し、候補者 × 求人のコサイン類似度を
+        1回の行列積で計算して求人ごとに上位候補者を抽出する
+        """
+        resume_paths = sorted(Path(resume_dir).glob('*.txt'))
+        if not resume_paths:
+            print(f"❌ 履歴書ファイル(.txt)が見つかりません: {resume_dir}")
+            sys.exit(1)
+        
+        # 1件のみの場合は通常の評価フロー
+        if len(resume_paths) == 1:
+            if not job_position:
+                print("❌ 履歴書が1件の場合は --job パラメータが必要です")
+                sys.exit(1)
+            candidate = self.analyze_resume(str(resume_paths[0]))
+            matching_result = self.evaluate_candidate(candidate, job_position)
+            self.print_evaluation_result(matching_result)
+            return {
+                "candidates": [candidate],
+                "rankings": {job_position: [{
+                    "file": resume_paths[0].name,
+                    "candidate_name": candidate.name,
+                    "overall_score": matching_result.overall_score
+                }]}
+            }
+        
+        try:
+            from .skill_embeddings import cosine_similarity_matrix, top_k_per_job
+        except ImportError:
+            print("❌ --batch には numpy が必要です: pip install numpy")
+            sys.exit(1)
+        
+        if not self.jobs_config_path.exists():
+            print("❌ 求人要件が設定されていません。--setup-job を実行してください。")
+            sys.exit(1)
+        
+        vocabulary, positions, job_vectors = self._job_embeddings()
+        if job_position:
+            if job_position not in positions:
+                print(f"❌ 職種 '{job_position}' の求人要件が見つかりません。")
+                print(f"利用可能な職種: {', '.join(positions)}")
+                sys.exit(1)
+            job_index = positions.index(job_position)
+            positions = [job_position]
+            job_vectors = job_vectors[job_index:job_index + 1]
+        
+        print(f"📂 {len(resume_paths)}件の履歴書を一括分析しています: {resume_dir}")
+        
+        # 履歴書分析（読み込めないファイルはスキップ）
+        analyzed_paths, candidates = self.batch_analyze(resume_paths)
+        
+        # 求人ベクトルは正規化済みのため、類似度は行列積のみで求まる（スキルは代表表記で照合）
+        candidate_vectors = vocabulary.encode([candidate.skills_set for candidate in candidates])
+        scores = cosine_similarity_matrix(candidate_vectors, job_vectors)
+        
+        rankings = {}
+        for job_index, indices in enumerate(top_k_per_job(scores, top_k)):
+            rankings[positions[job_index]] = [
+                {
+                    "file": analyzed_paths[index].name,
+                    "candidate_name": candidates[index].name,
+                    "skill_similarity": float(scores[index, job_index])
+                }
+                for index in indices
+            ]
+        
+        return {
+            "candidates": candidates,
+            "rankings": rankings
+        }
+    
+    def print_batch_result(self, batch_result: Dict):
+        """一括評価結果を出力"""
+        print("\n" + "="*60)
+        print("📊 AI採用支援システム - 一括評価結果")
+        print("="*60)
+        
+        for position, ranking in batch_result["rankings"].items():
+            print(f"\n💼 {position}")
+            for rank, entry in enumerate(ranking, 1):
+                if "skill_similarity" in entry:
+                    score = f"スキル類似度 {entry['skill_similarity'] * 100:.1f}%"
+                else:
+                    score = f"総合スコア {entry['overall_score']:.1f}点"
+                print(f"  {rank}. {entry['candidate_name']} ({entry['file']}) - {score}")
+    
     def evaluate_candidate(self, candidate: CandidateProfile, job_position: str) -> MatchingResult:
         """候補者を評価"""
+        from .hr_recruitment_system import CandidateMatcher, load_skill_weights
+        
         # 企業プロファイル読み込み
         company = self.load_company_profile()
         if not company:
@@ -170,8 +719,7 @@ class HRCLISystem:
             print("❌ 求人要件が設定されていません。--setup-job を実行してください。")
             sys.exit(1)
         
-        with open(self.jobs_config_path, 'r', encoding='utf-8') as f:
-            jobs_data = json.load(f)
+        jobs_data = self._load_jobs()
         
         if job_position not in jobs_data:
             print(f"❌ 職種 '{job_position}' の求人要件が見つかりません。")
@@ -179,155 +727,250 @@ class HRCLISystem:
             print(f"利用可能な職種: {', '.join(available)}")
             sys.exit(1)
         
-        job_req = JobRequirement(**jobs_data[job_position])
+        job_req = self._get_job_requirement(job_position)
         
         # マッチング実行
-        matcher = CandidateMatcher(company)
+        skill_weights = load_skill_weights(self.skill_weights_path) if self.skill_weights_path.exists() else None
+        matcher = CandidateMatcher(company, skill_weights)
         matching_result = matcher.calculate_match_score(candidate, job_req)
         
         return matching_result
     
-    def generate_interview_plan(self, candidate: CandidateProfile, job_position: str, stage: str) -> InterviewPlan:
-        """面接計画を生成"""
-        # ステージを変換
-        stage_map = {
-            "1st": InterviewStage.FIRST,
-            "2nd": InterviewStage.SECOND,
-            "final": InterviewStage.FINAL
-        }
+    def generate_interview_plan(self, candidate: CandidateProfile, job_position: str, stage: str,
+                                matching_result: Optional[MatchingResult] = None) -> InterviewPlan:
+        """面接計画を生成（評価済みの matching_result があれば再利用）"""
+        from .interview_system import InterviewStage
         
-        interview_stage = stage_map.get(stage)
-        if not interview_stage:
+        # ステージを変換
+        stage_name = _STAGE_MAP.get(stage)
+        if not stage_name:
             print(f"❌ 不正な面接ステージ: {stage}")
             print("利用可能なステージ: 1st, 2nd, final")
             sys.exit(1)
+        interview_stage = InterviewStage[stage_name]
         
-        # 求人要件とマッチング結果を取得
-        with open(self.jobs_config_path, 'r', encoding='utf-8') as f:
-            jobs_data = json.load(f)
+        # マッチング結果と求人要件を取得（評価時に設定の存在を確認済み）
+        if matching_result is None:
+            matching_result = self.evaluate_candidate(candidate, job_position)
         
-        job_req = JobRequirement(**jobs_data[job_position])
-        matching_result = self.evaluate_candidate(candidate, job_position)
+        job_req = self._get_job_requirement(job_position)
         
         # 面接計画生成
-        interview_plan = self.question_generator.generate_interview_plan(
+        interview_plan = self._get_question_generator().generate_interview_plan(
             candidate, job_req, matching_result, interview_stage
         )
         
         return interview_plan
     
+    def full_pipeline(self, resume_file_path: str, job_position: str) -> Tuple[CandidateProfile, MatchingResult, Dict[str, InterviewPlan]]:
+        """
+        履歴書の分析・評価と全ステージの面接計画生成を一度に実行
+        
+        分析とマッチング評価は1回だけ行い、その結果を各ステージの面接計画で共有する
+        """
+        candidate = self.analyze_resume(resume_file_path)
+        matching_result = self.evaluate_candidate(candidate, job_position)
+        interview_plans = {
+            stage: self.generate_interview_plan(candidate, job_position, stage, matching_result)
+            for stage in _STAGE_MAP
+        }
+        return candidate, matching_result, interview_plans
+    
     def print_evaluation_result(self, matching_result: MatchingResult):
         """評価結果を出力"""
-        print("\n" + "="*60)
-        print("🎯 AI採用支援システム - 候補者評価結果")
-        print("="*60)
+        # 1行ずつ print せず、まとめて1回で書き出す
+        parts = [
+            "\n" + "="*60,
+            "🎯 AI採用支援システム - 候補者評価結果",
+            "="*60
+        ]
         
-        print(f"📋 候補者名: {matching_result.candidate_name}")
-        print(f"🏆 総合スコア: {matching_result.overall_score:.1f}点")
+        parts.append(f"📋 候補者名: {matching_result.candidate_name}")
+        parts.append(f"🏆 総合スコア: {matching_result.overall_score:.1f}点")
         
         # 推薦判定を日本語化
-        recommendation_map = {
-            "pass": "✅ 推薦 - 即座に次のステップへ",
-            "interview": "🤔 要面接 - 面接で詳細確認が必要",
-            "reject": "❌ 不採用 - 要件に適合しない"
-        }
+        parts.append(f"📊 判定: {_RECOMMENDATION_MAP.get(matching_result.recommendation, matching_result.recommendation)}")
         
-        print(f"📊 判定: {recommendation_map.get(matching_result.recommendation, matching_result.recommendation)}")
+        parts.append(f"\n📈 詳細スコア:")
+        parts.append(f"  • スキルマッチ: {matching_result.skill_match_score:.1f}点")
+        parts.append(f"  • 経験マッチ: {matching_result.experience_match_score:.1f}点")
+        parts.append(f"  • 文化適合性: {matching_result.culture_fit_score:.1f}点")
+        parts.append(f"  • 学歴マッチ: {matching_result.education_match_score:.1f}点")
         
-        print(f"\n📈 詳細スコア:")
-        print(f"  • スキルマッチ: {matching_result.skill_match_score:.1f}点")
-        print(f"  • 経験マッチ: {matching_result.experience_match_score:.1f}点")
-        print(f"  • 文化適合性: {matching_result.culture_fit_score:.1f}点")
-        print(f"  • 学歴マッチ: {matching_result.education_match_score:.1f}点")
-        
-        print(f"\n🎯 面接重点分野:")
+        parts.append(f"\n🎯 面接重点分野:")
         for i, area in enumerate(matching_result.interview_focus_areas, 1):
-            print(f"  {i}. {area}")
+            parts.append(f"  {i}. {area}")
         
-        print(f"\n💡 詳細分析:")
+        parts.append(f"\n💡 詳細分析:")
         for key, analysis in matching_result.detailed_analysis.items():
-            print(f"  • {analysis}")
+            parts.append(f"  • {analysis}")
+        
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def print_interview_plan(self, interview_plan: InterviewPlan):
         """面接計画を出力"""
-        print("\n" + "="*60)
-        print(f"📝 {interview_plan.stage.value}計画")
-        print("="*60)
+        # 1行ずつ print せず、まとめて1回で書き出す
+        parts = [
+            "\n" + "="*60,
+            f"📝 {interview_plan.stage.value}計画",
+            "="*60
+        ]
         
-        print(f"👤 候補者: {interview_plan.candidate_name}")
-        print(f"💼 職種: {interview_plan.position}")
-        print(f"⏰ 予定時間: {interview_plan.duration_minutes}分")
+        parts.append(f"👤 候補者: {interview_plan.candidate_name}")
+        parts.append(f"💼 職種: {interview_plan.position}")
+        parts.append(f"⏰ 予定時間: {interview_plan.duration_minutes}分")
         
         if interview_plan.special_notes:
-            print(f"\n📌 特記事項:")
+            parts.append(f"\n📌 特記事項:")
             for note in interview_plan.special_notes:
-                print(f"  {note}")
+                parts.append(f"  {note}")
         
-        print(f"\n🎯 重点確認分野:")
+        parts.append(f"\n🎯 重点確認分野:")
         for area in interview_plan.focus_areas:
-            print(f"  • {area}")
+            parts.append(f"  • {area}")
         
-        print(f"\n❓ 面接質問一覧:")
+        parts.append(f"\n❓ 面接質問一覧:")
         for i, question in enumerate(interview_plan.questions, 1):
-            print(f"\n【質問 {i}】{question.category.value}")
-            print(f"Q: {question.question}")
+            parts.append(f"\n【質問 {i}】{question.category.value}")
+            parts.append(f"Q: {question.question}")
             
             if question.time_limit_minutes:
-                print(f"⏱️ 回答時間目安: {question.time_limit_minutes}分")
+                parts.append(f"⏱️ 回答時間目安: {question.time_limit_minutes}分")
             
-            print(f"🔍 評価ポイント:")
+            parts.append(f"🔍 評価ポイント:")
             for point in question.evaluation_points:
-                print(f"  • {point}")
+                parts.append(f"  • {point}")
             
             if question.follow_up_questions:
-                print(f"📋 追加質問例:")
+                parts.append(f"📋 追加質問例:")
                 for fq in question.follow_up_questions:
-                    print(f"  - {fq}")
+                    parts.append(f"  - {fq}")
             
-            print(f"✅ 良い回答例: {question.good_answer_example}")
+            parts.append(f"✅ 良い回答例: {question.good_answer_example}")
             
             if question.red_flags:
-                print(f"🚩 注意すべき回答:")
+                parts.append(f"🚩 注意すべき回答:")
                 for flag in question.red_flags:
-                    print(f"  • {flag}")
+                    parts.append(f"  • {flag}")
         
-        print(f"\n📊 評価基準:")
+        parts.append(f"\n📊 評価基準:")
         for criteria in interview_plan.evaluation_criteria:
-            print(f"\n• {criteria.criteria_name} (重み: {criteria.weight})")
-            print(f"  {criteria.description}")
+            parts.append(f"\n• {criteria.criteria_name} (重み: {criteria.weight})")
+            parts.append(f"  {criteria.description}")
             for level, desc in criteria.evaluation_levels.items():
-                print(f"    {level}点: {desc}")
+                parts.append(f"    {level}点: {desc}")
+        
+        sys.stdout.write("\n".join(parts) + "\n")
 
-def main():
-    """メインエントリーポイント"""
+# 引数なし（True）のオプションと値を取るオプション（属性名, 型）
+_FLAG_OPTIONS = {
+    '--setup-company': 'setup_company',
+    '--setup-job': 'setup_job',
+    '--build-skill-weights': 'build_skill_weights',
+}
+_VALUE_OPTIONS = {
+    '--analyze': ('analyze', str),
+    '--interview': ('interview', str),
+    '--batch': ('batch', str),
+    '--full': ('full', str),
+    '--import-company': ('import_company', str),
+    '--import-jobs': ('import_jobs', str),
+    '--top': ('top', int),
+    '--job': ('job', str),
+    '--stage': ('stage', str),
+    '--output': ('output', str),
+}
+_STAGE_CHOICES = tuple(_STAGE_MAP)
+
+def _build_parser():
+    """ヘルプ表示・エラー報告用の argparse パーサーを作成"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="HR採用支援システム", 
                                    formatter_class=argparse.RawDescriptionHelpFormatter,
                                    epilog="""
 使用例:
   # 初期設定
-  python hr_cli.py --setup-company
-  python hr_cli.py --setup-job
+  python %(prog)s --setup-company
+  python %(prog)s --setup-job
+  
+  # 設定ファイル（YAML/JSON）から一括登録
+  python %(prog)s --import-company company.yaml
+  python %(prog)s --import-jobs jobs.yaml
+  
+  # 登録済みの求人からスキルの重要度を作成（以降のスキルマッチを重み付きで計算）
+  python %(prog)s --build-skill-weights
   
   # 履歴書分析・評価
-  python hr_cli.py --analyze resume.txt --job "Webエンジニア"
+  python %(prog)s --analyze resume.txt --job "Webエンジニア"
   
   # 面接計画生成
-  python hr_cli.py --interview resume.txt --job "Webエンジニア" --stage 1st
+  python %(prog)s --interview resume.txt --job "Webエンジニア" --stage 1st
+  
+  # 評価と全ステージの面接計画を一括生成
+  python %(prog)s --full resume.txt --job "Webエンジニア" --output result.json
+  
+  # 履歴書の一括評価（ディレクトリ内の .txt を全求人と照合）
+  python %(prog)s --batch resumes/ --top 5
                                    """)
     
     parser.add_argument('--setup-company', action='store_true', help='企業プロファイルを設定')
     parser.add_argument('--setup-job', action='store_true', help='求人要件を設定')
+    parser.add_argument('--import-company', type=str, help='企業プロファイルを設定ファイル（YAML/JSON）から登録')
+    parser.add_argument('--import-jobs', type=str, help='求人要件を設定ファイル（YAML/JSON）から一括登録')
+    parser.add_argument('--build-skill-weights', action='store_true', help='登録済みの求人からスキルの重要度を作成')
     parser.add_argument('--analyze', type=str, help='履歴書ファイルを分析・評価')
     parser.add_argument('--interview', type=str, help='面接計画を生成')
+    parser.add_argument('--batch', type=str, help='ディレクトリ内の履歴書を一括評価')
+    parser.add_argument('--full', type=str, help='履歴書を評価し、全ステージの面接計画を生成')
+    parser.add_argument('--top', type=int, default=10, help='一括評価で表示する求人ごとの上位候補者数')
     parser.add_argument('--job', type=str, help='対象職種名')
     parser.add_argument('--stage', type=str, choices=['1st', '2nd', 'final'], help='面接ステージ')
     parser.add_argument('--output', type=str, help='結果を保存するファイル')
     
-    args = parser.parse_args()
+    return parser
+
+def _parse_args(argv: List[str]):
+    """
+    コマンドライン引数を解析
+    
+    通常の呼び出しは argparse を読み込まずに解析し、ヘルプ指定や
+    解釈できない引数の場合のみ argparse に任せる（使い方・エラーを表示）
+    """
+    defaults = {name: False for name in _FLAG_OPTIONS.values()}
+    defaults.update({name: None for name, _ in _VALUE_OPTIONS.values()}, top=10)
+    args = SimpleNamespace(**defaults)
+    
+    try:
+        i = 0
+        while i < len(argv):
+            option, has_value, value = argv[i].partition('=')
+            if option in _FLAG_OPTIONS and not has_value:
+                setattr(args, _FLAG_OPTIONS[option], True)
+            elif option in _VALUE_OPTIONS:
+                if not has_value:
+                    i += 1
+                    value = argv[i]
+                    if value.startswith('-'):
+                        raise ValueError(value)
+                name, value_type = _VALUE_OPTIONS[option]
+                setattr(args, name, value_type(value))
+            else:
+                raise ValueError(option)
+            i += 1
+        if args.stage is not None and args.stage not in _STAGE_CHOICES:
+            raise ValueError(args.stage)
+    except (IndexError, ValueError):
+        return _build_parser().parse_args(argv)
+    return args
+
+def main():
+    """メインエントリーポイント"""
+    args = _parse_args(sys.argv[1:])
     
     # 引数チェック
-    if not any([args.setup_company, args.setup_job, args.analyze, args.interview]):
-        parser.print_help()
+    if not any([args.setup_company, args.setup_job, args.import_company, args.import_jobs, args.build_skill_weights, args.analyze, args.interview, args.batch, args.full]):
+        _build_parser().print_help()
         sys.exit(1)
     
     cli = HRCLISystem()
@@ -339,6 +982,15 @@ def main():
         elif args.setup_job:
             cli.setup_job_requirement()
         
+        elif args.import_company:
+            cli.import_company_profile(args.import_company)
+        
+        elif args.import_jobs:
+            cli.import_job_requirements(args.import_jobs)
+        
+        elif args.build_skill_weights:
+            cli.build_skill_weights()
+        
         elif args.analyze:
             if not args.job:
                 print("❌ --job パラメータが必要です")
@@ -350,12 +1002,20 @@ def main():
             
             if args.output:
                 output_data = {
-                    "candidate": candidate.__dict__,
-                    "matching_result": matching_result.__dict__,
+                    "candidate": candidate,
+                    "matching_result": matching_result,
                     "timestamp": datetime.now().isoformat()
                 }
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, ensure_ascii=False, indent=2)
+                dump_json(output_data, args.output)
+                print(f"\n💾 結果を保存しました: {args.output}")
+        
+        elif args.batch:
+            batch_result = cli.batch_evaluate(args.batch, args.job, args.top)
+            cli.print_batch_result(batch_result)
+            
+            if args.output:
+                output_data = dict(batch_result, timestamp=datetime.now().isoformat())
+                dump_json(output_data, args.output)
                 print(f"\n💾 結果を保存しました: {args.output}")
         
         elif args.interview:
@@ -368,29 +1028,44 @@ def main():
             cli.print_interview_plan(interview_plan)
             
             if args.output:
+                # dataclass・Enum はそのまま渡し、dump_json で一括シリアライズ
                 output_data = {
-                    "interview_plan": {
-                        "candidate_name": interview_plan.candidate_name,
-                        "position": interview_plan.position,
-                        "stage": interview_plan.stage.value,
-                        "duration_minutes": interview_plan.duration_minutes,
-                        "questions": [q.__dict__ for q in interview_plan.questions],
-                        "evaluation_criteria": [c.__dict__ for c in interview_plan.evaluation_criteria],
-                        "focus_areas": interview_plan.focus_areas,
-                        "special_notes": interview_plan.special_notes
-                    },
+                    "interview_plan": interview_plan,
                     "timestamp": datetime.now().isoformat()
                 }
                 
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, ensure_ascii=False, indent=2)
+                dump_json(output_data, args.output)
                 print(f"\n💾 面接計画を保存しました: {args.output}")
         
+        elif args.full:
+            if not args.job:
+                print("❌ --job パラメータが必要です")
+                sys.exit(1)
+            
+            candidate, matching_result, interview_plans = cli.full_pipeline(args.full, args.job)
+            cli.print_evaluation_result(matching_result)
+            for interview_plan in interview_plans.values():
+                cli.print_interview_plan(interview_plan)
+            
+            if args.output:
+                output_data = {
+                    "candidate": candidate,
+                    "matching_result": matching_result,
+                    "interview_plans": interview_plans,
+                    "timestamp": datetime.now().isoformat()
+                }
+                dump_json(output_data, args.output)
+                print(f"\n💾 評価結果と面接計画を保存しました: {args.output}")
+        
     except KeyboardInterrupt:
         print("\n\n👋 処理を中断しました。")
         sys.exit(0)
     except Exception as e:
         print(f"\n❌ エラーが発生しました: {e}")
+        # スタックトレースは HR_DEBUG=1 指定時のみ表示
+        if os.environ.get("HR_DEBUG"):
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -8,14 +8,26 @@ import argparse
 import json
 import os
 import sys
+from enum import Enum
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 # 相対インポートを避けて直接インポート
 import hr_recruitment_system as hrs
 import interview_system as ivs
 
+def _json_default(obj):
+    """JSONで直接扱えない値（Enum・データクラス・読み取り専用の辞書）の変換"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if hasattr(obj, '__dataclass_fields__'):
+        return hrs.config_fields(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class HRCLISystem:
     """HR採用支援システムのCLIクラス"""
     
@@ -62,7 +74,7 @@ class HRCLISystem:
         
         # 設定を保存
         with open(self.company_config_path, 'w', encoding='utf-8') as f:
-            json.dump(company_profile.__dict__, f, ensure_ascii=False, indent=2)
+            json.dump(hrs.config_fields(company_profile), f, ensure_ascii=False, indent=2)
         
         print(f"\n✅ 企業プロファイルが保存されました: {self.company_config_path}")
         return company_profile
@@ -128,7 +140,7 @@ class HRCLISystem:
             with open(self.jobs_config_path, 'r', encoding='utf-8') as f:
                 jobs_data = json.load(f)
         
-        jobs_data[position_title] = job_req.__dict__
+        jobs_data[position_title] = hrs.config_fields(job_req)
         
         with open(self.jobs_config_path, 'w', encoding='utf-8') as f:
             json.dump(jobs_data, f, ensure_ascii=False, indent=2)
@@ -179,8 +191,9 @@ class HRCLISystem:
         
         return matching_result
     
-    def generate_interview_plan(self, candidate: hrs.CandidateProfile, job_position: str, stage: str) -> ivs.InterviewPlan:
-        """面接計画を生成"""
+    def generate_interview_plan(self, candidate: hrs.CandidateProfile, job_position: str, stage: str,
+                                matching_result: Optional[hrs.MatchingResult] = None) -> ivs.InterviewPlan:
+        """面接計画を生成（評価済みの matching_result があれば再評価しない）"""
         stage_map = {
             "1st": ivs.InterviewStage.FIRST,
             "2nd": ivs.InterviewStage.SECOND,
@@ -197,7 +210,8 @@ class HRCLISystem:
             jobs_data = json.load(f)
         
         job_req = hrs.JobRequirement(**jobs_data[job_position])
-        matching_result = self.evaluate_candidate(candidate, job_position)
+        if matching_result is None:
+            matching_result = self.evaluate_candidate(candidate, job_position)
         
         interview_plan = self.question_generator.generate_interview_plan(
             candidate, job_req, matching_result, interview_stage
@@ -205,6 +219,105 @@ class HRCLISystem:
         
         return interview_plan
     
+    def full_pipeline(self, resume_file_path: str, job_position: str):
+        """
+        履歴書の分析・評価と全ステージの面接計画生成を一度に実行
+        
+        分析とマッチング評価は1回だけ行い、その結果を各ステージの面接計画で共有する
+        """
+        candidate = self.analyze_resume(resume_file_path)
+        matching_result = self.evaluate_candidate(candidate, job_position)
+        interview_plans = {
+            stage: self.generate_interview_plan(candidate, job_position, stage, matching_result)
+            for stage in ("1st", "2nd", "final")
+        }
+        return candidate, matching_result, interview_plans
+    
+    def batch_evaluate(self, resume_dir: str, job_position: Optional[str] = None, top_k: int = 10) -> Dict:
+        """
+        ディレクトリ内の履歴書を一括評価
+        
+        候補者と求人の必須スキルをベクトル化し、候補者 × 求人のコサイン類似度を
+        1回の行列積で計算して求人ごとに上位候補者を抽出する
+        """
+        try:
+            import skill_embeddings as emb
+        except ImportError:
+            print("❌ --batch には numpy が必要です: pip install numpy")
+            sys.exit(1)
+        
+        resume_paths = sorted(Path(resume_dir).glob('*.txt'))
+        if not resume_paths:
+            print(f"❌ 履歴書ファイル(.txt)が見つかりません: {resume_dir}")
+            sys.exit(1)
+        
+        if not self.jobs_config_path.exists():
+            print("❌ 求人要件が設定されていません。--setup-job を実行してください。")
+            sys.exit(1)
+        
+        with open(self.jobs_config_path, 'r', encoding='utf-8') as f:
+            jobs_data = json.load(f)
+        
+        if job_position:
+            if job_position not in jobs_data:
+                print(f"❌ 職種 '{job_position}' の求人要件が見つかりません。")
+                print(f"利用可能な職種: {', '.join(jobs_data.keys())}")
+                sys.exit(1)
+            jobs_data = {job_position: jobs_data[job_position]}
+        
+        print(f"📂 {len(resume_paths)}件の履歴書を一括分析しています: {resume_dir}")
+        
+        # 履歴書分析（読み込めないファイルはスキップ）
+        analyzed_paths = []
+        resume_texts = []
+        for path in resume_paths:
+            try:
+                resume_texts.append(path.read_text(encoding='utf-8'))
+                analyzed_paths.append(path)
+            except Exception as e:
+                print(f"⚠️ ファイルの読み込みに失敗しました: {path} ({e})")
+        candidates = self.analyzer.extract_batch(resume_texts)
+        
+        # スキル語彙（抽出対象スキル + 求人要件のスキル）。表記ゆれを吸収するため代表表記（skill_key）で持つ
+        job_reqs = [hrs.JobRequirement(**data) for data in jobs_data.values()]
+        vocabulary = emb.SkillVocabulary(map(hrs.skill_key,
+            [skill for skills in self.analyzer.skill_keywords.values() for skill in skills] +
+            [skill for job_req in job_reqs for skill in job_req.required_skills]
+        ))
+        scores = emb.cosine_similarity_matrix(
+            vocabulary.encode([candidate.skills_set for candidate in candidates]),
+            vocabulary.encode([job_req.required_skills_set for job_req in job_reqs])
+        )
+        
+        positions = list(jobs_data)
+        rankings = {}
+        for job_index, indices in enumerate(emb.top_k_per_job(scores, top_k)):
+            rankings[positions[job_index]] = [
+                {
+                    "file": analyzed_paths[index].name,
+                    "candidate_name": candidates[index].name,
+                    "skill_similarity": float(scores[index, job_index])
+                }
+                for index in indices
+            ]
+        
+        return {
+            "candidates": candidates,
+            "rankings": rankings
+        }
+    
+    def print_batch_result(self, batch_result: Dict):
+        """一括評価結果を出力"""
+        print("\n" + "="*60)
+        print("📊 AI採用支援システム - 一括評価結果")
+        print("="*60)
+        
+        for position, ranking in batch_result["rankings"].items():
+            print(f"\n💼 {position}")
+            for rank, entry in enumerate(ranking, 1):
+                print(f"  {rank}. {entry['candidate_name']} ({entry['file']}) - "
+                      f"スキル類似度 {entry['skill_similarity'] * 100:.1f}%")
+    
     def print_evaluation_result(self, matching_result: hrs.MatchingResult):
         """評価結果を出力"""
         print("\n" + "="*60)
@@ -294,19 +407,28 @@ def main():
   
   # 面接計画生成
   python hr_cli_standalone.py --interview resume.txt --job "Webエンジニア" --stage 1st
+  
+  # 評価と全ステージの面接計画をまとめて生成
+  python hr_cli_standalone.py --full resume.txt --job "Webエンジニア"
+  
+  # ディレクトリ内の履歴書を一括評価（求人ごとの上位候補者）
+  python hr_cli_standalone.py --batch resumes/ --top 5
                                    """)
     
     parser.add_argument('--setup-company', action='store_true', help='企業プロファイルを設定')
     parser.add_argument('--setup-job', action='store_true', help='求人要件を設定')
     parser.add_argument('--analyze', type=str, help='履歴書ファイルを分析・評価')
     parser.add_argument('--interview', type=str, help='面接計画を生成')
+    parser.add_argument('--batch', type=str, help='ディレクトリ内の履歴書を一括評価')
+    parser.add_argument('--full', type=str, help='履歴書を評価し、全ステージの面接計画を生成')
+    parser.add_argument('--top', type=int, default=10, help='一括評価で表示する求人ごとの上位候補者数')
     parser.add_argument('--job', type=str, help='対象職種名')
     parser.add_argument('--stage', type=str, choices=['1st', '2nd', 'final'], help='面接ステージ')
     parser.add_argument('--output', type=str, help='結果を保存するファイル')
     
     args = parser.parse_args()
     
-    if not any([args.setup_company, args.setup_job, args.analyze, args.interview]):
+    if not any([args.setup_company, args.setup_job, args.analyze, args.interview, args.batch, args.full]):
         parser.print_help()
         sys.exit(1)
     
@@ -330,12 +452,22 @@ def main():
             
             if args.output:
                 output_data = {
-                    "candidate": candidate.__dict__,
-                    "matching_result": matching_result.__dict__,
+                    "candidate": hrs.config_fields(candidate),
+                    "matching_result": hrs.config_fields(matching_result),
                     "timestamp": datetime.now().isoformat()
                 }
                 with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, ensure_ascii=False, indent=2)
+                    json.dump(output_data, f, ensure_ascii=False, indent=2, default=_json_default)
+                print(f"\n💾 結果を保存しました: {args.output}")
+        
+        elif args.batch:
+            batch_result = cli.batch_evaluate(args.batch, args.job, args.top)
+            cli.print_batch_result(batch_result)
+            
+            if args.output:
+                output_data = dict(batch_result, timestamp=datetime.now().isoformat())
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    json.dump(output_data, f, ensure_ascii=False, indent=2, default=_json_default)
                 print(f"\n💾 結果を保存しました: {args.output}")
         
         elif args.interview:
@@ -354,8 +486,8 @@ def main():
                         "position": interview_plan.position,
                         "stage": interview_plan.stage.value,
                         "duration_minutes": interview_plan.duration_minutes,
-                        "questions": [q.__dict__ for q in interview_plan.questions],
-                        "evaluation_criteria": [c.__dict__ for c in interview_plan.evaluation_criteria],
+                        "questions": [hrs.config_fields(q) for q in interview_plan.questions],
+                        "evaluation_criteria": [hrs.config_fields(c) for c in interview_plan.evaluation_criteria],
                         "focus_areas": interview_plan.focus_areas,
                         "special_notes": interview_plan.special_notes
                     },
@@ -363,9 +495,30 @@ def main():
                 }
                 
                 with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, ensure_ascii=False, indent=2)
+                    json.dump(output_data, f, ensure_ascii=False, indent=2, default=_json_default)
                 print(f"\n💾 面接計画を保存しました: {args.output}")
         
+        elif args.full:
+            if not args.job:
+                print("❌ --job パラメータが必要です")
+                sys.exit(1)
+            
+            candidate, matching_result, interview_plans = cli.full_pipeline(args.full, args.job)
+            cli.print_evaluation_result(matching_result)
+            for interview_plan in interview_plans.values():
+                cli.print_interview_plan(interview_plan)
+            
+            if args.output:
+                output_data = {
+                    "candidate": hrs.config_fields(candidate),
+                    "matching_result": hrs.config_fields(matching_result),
+                    "interview_plans": interview_plans,
+                    "timestamp": datetime.now().isoformat()
+                }
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    json.dump(output_data, f, ensure_ascii=False, indent=2, default=_json_default)
+                print(f"\n💾 評価結果と面接計画を保存しました: {args.output}")
+        
     except KeyboardInterrupt:
         print("\n\n👋 処理を中断しました。")
         sys.exit(0)
@@ -4,10 +4,17 @@ AI活用採用支援システム
 人事・総務業務効率化のためのメイン制御システム
 """
 
+import hashlib
 import json
+import os
 import re
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Tuple
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Optional, Tuple, FrozenSet, Any
 from datetime import datetime
 import logging
 
@@ -15,7 +22,7 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CandidateProfile:
     """候補者プロファイル"""
     name: str
@@ -29,8 +36,17 @@ class CandidateProfile:
     languages: List[str]
     salary_expectation: Optional[int] = None
     location: Optional[str] = None
+    # 派生フィールド（マッチング用に生成時に事前計算）
+    skills_set: FrozenSet[str] = field(init=False, repr=False, compare=False)  # スキルの代表表記
+    education_level_max: int = field(init=False, repr=False, compare=False)   # 最高学歴の水準（該当なしは0）
+    languages_set: FrozenSet[str] = field(init=False, repr=False, compare=False)  # 言語の所属判定用
 
-@dataclass
+    def __post_init__(self):
+        object.__setattr__(self, "skills_set", frozenset(map(skill_key, self.skills)))
+        object.__setattr__(self, "education_level_max", _max_education_level(self.education))
+        object.__setattr__(self, "languages_set", frozenset(self.languages))
+
+@dataclass(frozen=True, slots=True)
 class CompanyProfile:
     """企業プロファイル"""
     company_name: str
@@ -40,7 +56,7 @@ class CompanyProfile:
     culture_keywords: List[str]  # 組織文化
     work_style: List[str]  # 働き方
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobRequirement:
     """求人要件"""
     position_title: str
@@ -54,8 +70,15 @@ class JobRequirement:
     employment_type: str  # full-time, contract, etc.
     remote_work: bool
     travel_required: bool
+    # 派生フィールド（スキル照合用に生成時に事前計算、CandidateProfile.skills_set と同じ代表表記）
+    required_skills_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    preferred_skills_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "required_skills_set", frozenset(map(skill_key, self.required_skills)))
+        object.__setattr__(self, "preferred_skills_set", frozenset(map(skill_key, self.preferred_skills)))
 
-@dataclass
+@dataclass(slots=True)
 class MatchingResult:
     """マッチング結果"""
     candidate_name: str
@@ -68,6 +91,38 @@ class MatchingResult:
     recommendation: str  # pass, interview, reject
     interview_focus_areas: List[str]
 
+def config_fields(profile) -> Dict[str, Any]:
+    """設定保存用に、派生フィールドを除いたデータクラスのフィールドを辞書化"""
+    return {f.name: getattr(profile, f.name) for f in fields(profile) if f.init}
+
+# 履歴書から情報を抽出する正規表現（モジュール読み込み時に1回だけコンパイル）
+_NAME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'氏名[：:\s]*([^\n\r]+)',
+    r'名前[：:\s]*([^\n\r]+)',
+    r'姓名[：:\s]*([^\n\r]+)'
+))
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# 電話番号は1回の検索で済むよう選択にまとめ、具体的な形式（国番号付き → ハイフン区切り → 数字のみ）を先に置く
+_PHONE_PATTERN = re.compile(r'(\+81-\d+-\d+-\d+|\d{2,4}-\d{2,4}-\d{4}|\d{10,11})')
+_DATE_PATTERN = re.compile(r'(\d{4})年(\d{1,2})月')
+
+# 学歴・資格・言語のキーワード（大文字小文字を区別して照合）
+_EDUCATION_KEYWORDS = ("大学", "大学院", "短期大学", "高等学校", "専門学校")
+_CERTIFICATION_KEYWORDS = (
+    "TOEIC", "英検", "簿記", "基本情報技術者", "応用情報技術者",
+    "宅建", "FP", "社労士", "税理士", "公認会計士"
+)
+_LANGUAGE_KEYWORDS = ("英語", "中国語", "韓国語", "フランス語", "ドイツ語", "スペイン語")
+
+# 抽出結果を保持する履歴書の件数（同一テキストの再分析をスキップ）
+PROFILE_MEMO_SIZE = 4096
+# extract_batch でプロセスプールを使う最小件数（これ未満は起動コストの方が大きい）
+BATCH_PARALLEL_MIN = 8
+
+def _profile_memo_key(resume_text: str) -> bytes:
+    """抽出結果キャッシュのキー（長いテキストをそのまま保持しないようダイジェスト化）"""
+    return hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).digest()
+
 class ResumeAnalyzer:
     """履歴書・職務経歴書分析エンジン"""
     
@@ -80,11 +135,91 @@ class ResumeAnalyzer:
             "design": ["UI/UX", "Photoshop", "Illustrator", "Figma", "デザイン思考"],
             "finance": ["財務", "会計", "簿記", "税務", "資金調達", "投資"]
         }
+        # スキル名をインターンし、候補者間で同一の文字列オブジェクトを共有
+        self.skill_keywords = {
+            category: [sys.intern(skill) for skill in skills]
+            for category, skills in self.skill_keywords.items()
+        }
+        # スキル照合用に (スキル名, 小文字化したスキル名) を事前に作成
+        # （重複はここで除いておき、抽出結果は辞書の定義順になる）
+        self._skill_lookup = tuple(
+            (skill, skill.lower())
+            for skill in dict.fromkeys(
+                skill for skills in self.skill_keywords.values() for skill in skills
+            )
+        )
+        # 履歴書テキストのハッシュ → 抽出済みプロファイル（LRU、スレッド間で共有）
+        self._profile_memo = OrderedDict()
+        self._profile_memo_lock = threading.Lock()
 
     def extract_candidate_profile(self, resume_text: str) -> CandidateProfile:
         """
         履歴書テキストから候補者プロファイルを抽出
         
+        抽出結果はテキストのハッシュで最大 PROFILE_MEMO_SIZE 件保持し、同じテキストには
+        同じプロファイルを返す（呼び出し側で変更しないこと）
+        """
+        memo_key = _profile_memo_key(resume_text)
+        profile = self._recall_profile(memo_key)
+        if profile is None:
+            profile = self._extract_candidate_profile(resume_text)
+            self._remember_profile(memo_key, profile)
+        return profile
+    
+    def extract_batch(self, resume_texts: List[str], max_workers: Optional[int] = None) -> List[CandidateProfile]:
+        """
+        複数の履歴書テキストからプロファイルを抽出（入力と同じ順序で返す）
+        
+        キャッシュにないものが BATCH_PARALLEL_MIN 件以上あればプロセスプールで並列に抽出する
+        """
+        memo_keys = [_profile_memo_key(text) for text in resume_texts]
+        profiles = [self._recall_profile(key) for key in memo_keys]
+        pending = [index for index, profile in enumerate(profiles) if profile is None]
+        
+        executor = None
+        if len(pending) >= BATCH_PARALLEL_MIN:
+            max_workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            try:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            except (OSError, NotImplementedError) as e:
+                # マルチプロセスが使えない環境（サーバーレス等）では逐次処理
+                logger.warning(f"プロセスプールを利用できないため逐次処理します: {e}")
+        
+        if executor is None:
+            extracted = [self._extract_candidate_profile(resume_texts[index]) for index in pending]
+        else:
+            with executor:
+                # ワーカーごとにまとめて渡し、プロセス間通信の回数を抑える
+                chunksize = max(1, min(32, len(pending) // max_workers))
+                extracted = list(executor.map(
+                    _extract_shared_profile, [resume_texts[index] for index in pending], chunksize=chunksize
+                ))
+        
+        for index, profile in zip(pending, extracted):
+            profiles[index] = profile
+            self._remember_profile(memo_keys[index], profile)
+        return profiles
+    
+    def _recall_profile(self, memo_key: bytes) -> Optional[CandidateProfile]:
+        """キャッシュ済みのプロファイルを取得（なければ None）"""
+        with self._profile_memo_lock:
+            profile = self._profile_memo.get(memo_key)
+            if profile is not None:
+                self._profile_memo.move_to_end(memo_key)
+            return profile
+    
+    def _remember_profile(self, memo_key: bytes, profile: CandidateProfile):
+        """プロファイルをキャッシュに登録（上限を超えたら古い順に破棄）"""
+        with self._profile_memo_lock:
+            self._profile_memo[memo_key] = profile
+            self._profile_memo.move_to_end(memo_key)
+            while len(self._profile_memo) > PROFILE_MEMO_SIZE:
+                self._profile_memo.popitem(last=False)
+    
+    def _extract_candidate_profile(self, resume_text: str) -> CandidateProfile:
+        """
+        履歴書テキストから候補者プロファイルを抽出（キャッシュなし）
+        
         実際の実装では、AIを使ってより精密に抽出します
         """
         logger.info("履歴書の分析を開始します...")
@@ -94,8 +229,8 @@ class ResumeAnalyzer:
         email = self._extract_email(resume_text)
         phone = self._extract_phone(resume_text)
         
-        # スキルの抽出
-        skills = self._extract_skills(resume_text)
+        # スキル・学歴・資格・言語スキルのキーワード照合
+        skills, education, certifications, languages = self._scan_keywords(resume_text)
         
         # 職歴の抽出
         work_history = self._extract_work_history(resume_text)
@@ -103,15 +238,6 @@ class ResumeAnalyzer:
         # 経験年数の計算
         experience_years = self._calculate_experience_years(work_history)
         
-        # 学歴の抽出
-        education = self._extract_education(resume_text)
-        
-        # 資格の抽出
-        certifications = self._extract_certifications(resume_text)
-        
-        # 言語スキルの抽出
-        languages = self._extract_languages(resume_text)
-        
         return CandidateProfile(
             name=name,
             email=email,
@@ -127,14 +253,8 @@ class ResumeAnalyzer:
     def _extract_name(self, text: str) -> str:
         """名前を抽出"""
         # 簡略実装 - 実際はAIで抽出
-        name_patterns = [
-            r'氏名[：:\s]*([^\n\r]+)',
-            r'名前[：:\s]*([^\n\r]+)',
-            r'姓名[：:\s]*([^\n\r]+)'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, text)
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -142,130 +262,219 @@ class ResumeAnalyzer:
     
     def _extract_email(self, text: str) -> str:
         """メールアドレスを抽出"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
+        match = _EMAIL_PATTERN.search(text)
         return match.group(0) if match else ""
     
     def _extract_phone(self, text: str) -> str:
         """電話番号を抽出"""
-        phone_patterns = [
-            r'(\d{2,4}-\d{2,4}-\d{4})',
-            r'(\d{10,11})',
-            r'(\+81-\d+-\d+-\d+)'
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        
-        return ""
+        match = _PHONE_PATTERN.search(text)
+        return match.group(1) if match else ""
     
-    def _extract_skills(self, text: str) -> List[str]:
-        """スキルを抽出"""
-        found_skills = []
+    def _scan_keywords(self, text: str) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """
+        スキル・学歴・資格・言語スキルをまとめて抽出
         
-        for category, skills in self.skill_keywords.items():
-            for skill in skills:
-                if skill.lower() in text.lower():
-                    found_skills.append(skill)
+        スキルは大文字小文字を区別しないため、テキストの小文字化は1回だけ行う。
+        全キーワードを1つの正規表現（選択 | ）にまとめる方式は、重なり合うキーワード
+        （"JavaScript" 中の "Java"、"大学院" 中の "大学" など）を取りこぼし、
+        計測でも部分文字列検索（in）の繰り返しより数倍遅いため採用しない
+        """
+        lowered_text = text.lower()
+        skills = [skill for skill, lowered_skill in self._skill_lookup if lowered_skill in lowered_text]
         
-        return list(set(found_skills))  # 重複を除去
+        education = [f"{keyword}卒業" for keyword in _EDUCATION_KEYWORDS if keyword in text]
+        certifications = [cert for cert in _CERTIFICATION_KEYWORDS if cert in text]
+        languages = [lang for lang in _LANGUAGE_KEYWORDS if lang in text]
+        
+        return skills, education, certifications, languages
     
     def _extract_work_history(self, text: str) -> List[Dict[str, str]]:
         """職歴を抽出"""
         # 簡略実装 - 実際はAIでより詳細に抽出
-        work_history = []
-        
-        # 年月日のパターンを探す
-        date_patterns = r'(\d{4})年(\d{1,2})月'
-        dates = re.findall(date_patterns, text)
-        
-        if dates:
-            for i, (year, month) in enumerate(dates):
-                work_history.append({
-                    "period": f"{year}年{month}月",
-                    "company": f"会社{i+1}",  # 実際はAIで抽出
-                    "position": f"職位{i+1}",  # 実際はAIで抽出
-                    "description": "職務内容"  # 実際はAIで抽出
-                })
-        
-        return work_history
+        # 年月のパターンを順に走査し、一致の一覧を作らずにそのまま職歴へ変換
+        return [
+            {
+                "period": f"{match[1]}年{match[2]}月",
+                "company": f"会社{i+1}",  # 実際はAIで抽出
+                "position": f"職位{i+1}",  # 実際はAIで抽出
+                "description": "職務内容"  # 実際はAIで抽出
+            }
+            for i, match in enumerate(_DATE_PATTERN.finditer(text))
+        ]
     
     def _calculate_experience_years(self, work_history: List[Dict[str, str]]) -> int:
         """経験年数を計算"""
         # 簡略実装 - 実際は期間を正確に計算
         return len(work_history) * 2  # 仮の計算
+
+# 学歴区分と水準（数値が大きいほど高い）
+_EDUCATION_LEVELS = {
+    "高等学校": 1,
+    "専門学校": 2,
+    "短期大学": 3,
+    "大学": 4,
+    "大学院": 5
+}
+
+# 長い区分名から照合し、「短期大学」「大学院」が「大学」として扱われないようにする
+_EDUCATION_LEVELS_LONGEST_FIRST = tuple(
+    sorted(_EDUCATION_LEVELS.items(), key=lambda item: len(item[0]), reverse=True)
+)
+
+def _max_education_level(education: List[str]) -> int:
+    """学歴一覧から最高の学歴水準を求める（該当なしは0）"""
+    max_level = 0
+    for edu in education:
+        for level_name, level_value in _EDUCATION_LEVELS_LONGEST_FIRST:
+            if level_name in edu:
+                max_level = max(max_level, level_value)
+                break
+    return max_level
+
+# 表記ゆれ・略称の正規化表（正規化後の表記 → 代表表記）
+_SKILL_ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+    "ml": "machinelearning",
+    "機械学習": "machinelearning",
+    "ai": "artificialintelligence",
+    "人工知能": "artificialintelligence",
+    "uxui": "ui/ux",
+    "ux/ui": "ui/ux",
+    "uiux": "ui/ux",
+}
+_SKILL_SEPARATORS = re.compile(r'[\s\-_・]+')
+
+@lru_cache(maxsize=4096)
+def skill_key(skill: str) -> str:
+    """
+    スキル名を照合用の代表表記に正規化
     
-    def _extract_education(self, text: str) -> List[str]:
-        """学歴を抽出"""
-        education_keywords = ["大学", "大学院", "短期大学", "高等学校", "専門学校"]
-        education = []
-        
-        for keyword in education_keywords:
-            if keyword in text:
-                education.append(f"{keyword}卒業")
-        
-        return education
+    大文字小文字・空白・区切り記号・「.js」接尾辞の違いを吸収し、
+    略称は _SKILL_ALIASES で代表表記に寄せる（例: "React.js" → "react", "ML" → "machinelearning"）。
+    代表表記はインターンし、候補者・求人のスキル集合の照合が同一オブジェクト同士の比較で済むようにする
+    """
+    key = _SKILL_SEPARATORS.sub("", skill.lower())
+    if len(key) > 2 and key.endswith("js"):
+        key = key[:-2].rstrip(".")
+    return sys.intern(_SKILL_ALIASES.get(key, key))
+
+def skill_rca_weights(job_reqs: List[JobRequirement]) -> Dict[str, float]:
+    """
+    求人群からスキルの重要度（RCA に基づく重み）を算出
     
-    def _extract_certifications(self, text: str) -> List[str]:
-        """資格を抽出"""
-        cert_keywords = [
-            "TOEIC", "英検", "簿記", "基本情報技術者", "応用情報技術者",
-            "宅建", "FP", "社労士", "税理士", "公認会計士"
-        ]
-        certifications = []
-        
-        for cert in cert_keywords:
-            if cert in text:
-                certifications.append(cert)
-        
-        return certifications
+    各スキルの出現割合の逆数を、平均的な出現頻度のスキルが1になるよう正規化する。
+    多くの求人で求められる一般的なスキルほど重みが小さく、希少なスキルほど大きい
+    """
+    counts: Dict[str, int] = {}
+    for job_req in job_reqs:
+        for skill in job_req.required_skills + job_req.preferred_skills:
+            key = skill_key(skill)
+            counts[key] = counts.get(key, 0) + 1
+    if not counts:
+        return {}
+    mean_count = sum(counts.values()) / len(counts)
+    return {key: mean_count / count for key, count in counts.items()}
+
+def save_skill_weights(path, skill_weights: Dict[str, float]):
+    """スキルの重みを .npz（skills・weights の2配列）として保存"""
+    import numpy as np
     
-    def _extract_languages(self, text: str) -> List[str]:
-        """言語スキルを抽出"""
-        languages = ["英語", "中国語", "韓国語", "フランス語", "ドイツ語", "スペイン語"]
-        found_languages = []
-        
-        for lang in languages:
-            if lang in text:
-                found_languages.append(lang)
-        
-        return found_languages
+    np.savez(path, skills=np.array(list(skill_weights), dtype=str),
+             weights=np.array(list(skill_weights.values()), dtype=np.float64))
+
+def load_skill_weights(path) -> Dict[str, float]:
+    """save_skill_weights で保存したスキルの重みを読み込み"""
+    import numpy as np
+    
+    with np.load(path) as data:
+        return dict(zip(data["skills"].tolist(), data["weights"].tolist()))
+
+def _skill_hits(candidate_skills: FrozenSet[str], skills: List[str],
+                weights: Optional[Dict[str, float]]) -> Tuple[float, float]:
+    """要求スキルのうち候補者が持つものの重みの合計と、要求スキル全体の重みの合計"""
+    hits = total = 0.0
+    for skill in skills:
+        key = skill_key(skill)
+        weight = weights.get(key, 1.0) if weights else 1.0
+        total += weight
+        if key in candidate_skills:
+            hits += weight
+    return hits, total
 
 class CandidateMatcher:
     """候補者マッチングエンジン"""
     
-    def __init__(self, company_profile: CompanyProfile):
+    def __init__(self, company_profile: CompanyProfile, skill_weights: Optional[Dict[str, float]] = None):
         self.company_profile = company_profile
+        # スキルの重要度（代表表記 → 重み、未指定のスキルは1）。None なら全スキル均等
+        self.skill_weights = (
+            {skill_key(skill): weight for skill, weight in skill_weights.items()}
+            if skill_weights else None
+        )
+    
+    # 各項目の重み
+    _WEIGHTS = {
+        "skill": 0.4,      # スキルマッチ 40%
+        "experience": 0.25, # 経験 25%
+        "culture": 0.20,    # 文化適合性 20%
+        "education": 0.15   # 学歴 15%
+    }
     
     def calculate_match_score(self, candidate: CandidateProfile, job_req: JobRequirement) -> MatchingResult:
         """
         候補者と求人要件のマッチ度を計算
         """
         logger.info(f"候補者 {candidate.name} のマッチング分析を開始...")
+        return self._build_matching_result(candidate, job_req, *self._score_pair(candidate, job_req))
+    
+    def _score_pair(self, candidate: CandidateProfile, job_req: JobRequirement) -> Tuple[float, float, float, float]:
+        """
+        候補者1名 × 求人1件の項目別スコア（スキル・経験・文化適合性・学歴）を計算
+        """
+        # スキル: 一致したスキルの重みの合計 / 要求スキルの重みの合計
+        required_hits, required_count = _skill_hits(candidate.skills_set, job_req.required_skills, self.skill_weights)
+        if required_count > 0:
+            skill_score = required_hits / required_count * 80
+            preferred_hits, preferred_count = _skill_hits(candidate.skills_set, job_req.preferred_skills, self.skill_weights)
+            if preferred_count > 0:
+                skill_score += preferred_hits / preferred_count * 20
+            else:
+                skill_score += 20.0
+            skill_score = min(100.0, skill_score)
+        else:
+            skill_score = 100.0
         
-        # 各項目の重み
-        weights = {
-            "skill": 0.4,      # スキルマッチ 40%
-            "experience": 0.25, # 経験 25%
-            "culture": 0.20,    # 文化適合性 20%
-            "education": 0.15   # 学歴 15%
-        }
-        
-        # スキルマッチスコア計算
-        skill_score = self._calculate_skill_match(candidate.skills, job_req.required_skills, job_req.preferred_skills)
-        
-        # 経験マッチスコア計算
-        experience_score = self._calculate_experience_match(candidate.experience_years, job_req.required_years)
+        # 経験
+        years = candidate.experience_years
+        required_years = job_req.required_years
+        if years >= required_years:
+            experience_score = 100.0 if years <= required_years * 1.5 else 95.0
+        else:
+            experience_score = max(0.0, years / required_years * 80)
         
-        # 文化適合性スコア計算
-        culture_score = self._calculate_culture_fit(candidate, self.company_profile)
+        # 文化適合性（簡略実装: 言語スキル・経験年数・資格取得の3指標）
+        culture_indicators = ("英語" in candidate.languages_set) + (years >= 3) + bool(candidate.certifications)
+        culture_score = culture_indicators / 3 * 100
         
-        # 学歴マッチスコア計算
-        education_score = self._calculate_education_match(candidate.education, job_req.education_level)
+        # 学歴
+        required_level = _EDUCATION_LEVELS.get(job_req.education_level, 4)
+        if candidate.education_level_max >= required_level:
+            education_score = 100.0
+        else:
+            education_score = candidate.education_level_max / required_level * 100
         
+        return skill_score, experience_score, culture_score, education_score
+    
+    def _build_matching_result(self, candidate: CandidateProfile, job_req: JobRequirement,
+                               skill_score: float, experience_score: float,
+                               culture_score: float, education_score: float) -> MatchingResult:
+        """項目別スコアから総合スコア・詳細分析を含むマッチング結果を作成"""
         # 総合スコア計算
+        weights = self._WEIGHTS
         overall_score = (
             skill_score * weights["skill"] +
             experience_score * weights["experience"] +
@@ -273,14 +482,14 @@ class CandidateMatcher:
             education_score * weights["education"]
         )
         
+        # 推薦判定
+        recommendation = self._make_recommendation(overall_score)
+        
         # 詳細分析
         detailed_analysis = self._generate_detailed_analysis(
             candidate, job_req, skill_score, experience_score, culture_score, education_score
         )
         
-        # 推薦判定
-        recommendation = self._make_recommendation(overall_score)
-        
         # 面接重点分野
         interview_focus = self._identify_interview_focus_areas(
             candidate, job_req, skill_score, experience_score
@@ -298,79 +507,6 @@ class CandidateMatcher:
             interview_focus_areas=interview_focus
         )
     
-    def _calculate_skill_match(self, candidate_skills: List[str], required_skills: List[str], preferred_skills: List[str]) -> float:
-        """スキルマッチ度を計算"""
-        if not required_skills:
-            return 100.0
-        
-        required_matches = sum(1 for skill in required_skills if skill in candidate_skills)
-        required_score = (required_matches / len(required_skills)) * 80  # 必須スキルは80点満点
-        
-        if preferred_skills:
-            preferred_matches = sum(1 for skill in preferred_skills if skill in candidate_skills)
-            preferred_score = (preferred_matches / len(preferred_skills)) * 20  # 優遇スキルは20点満点
-        else:
-            preferred_score = 20.0  # 優遇スキルがない場合は満点
-        
-        return min(100.0, required_score + preferred_score)
-    
-    def _calculate_experience_match(self, candidate_years: int, required_years: int) -> float:
-        """経験年数マッチ度を計算"""
-        if candidate_years >= required_years:
-            # 必要年数を満たしている場合
-            if candidate_years <= required_years * 1.5:
-                return 100.0  # 理想的な範囲
-            else:
-                # オーバースペック（減点はしない）
-                return 95.0
-        else:
-            # 必要年数に満たない場合
-            ratio = candidate_years / required_years
-            return max(0.0, ratio * 80)  # 最大80点
-    
-    def _calculate_culture_fit(self, candidate: CandidateProfile, company: CompanyProfile) -> float:
-        """文化適合性を計算"""
-        # 簡略実装 - 実際はより複雑な分析を行う
-        culture_indicators = 0
-        total_indicators = 3
-        
-        # 言語スキル（グローバル企業の場合）
-        if "英語" in candidate.languages:
-            culture_indicators += 1
-        
-        # 経験年数（安定性の指標）
-        if candidate.experience_years >= 3:
-            culture_indicators += 1
-        
-        # 資格取得（学習意欲の指標）
-        if candidate.certifications:
-            culture_indicators += 1
-        
-        return (culture_indicators / total_indicators) * 100
-    
-    def _calculate_education_match(self, candidate_education: List[str], required_education: str) -> float:
-        """学歴マッチ度を計算"""
-        education_levels = {
-            "高等学校": 1,
-            "専門学校": 2,
-            "短期大学": 3,
-            "大学": 4,
-            "大学院": 5
-        }
-        
-        required_level = education_levels.get(required_education, 4)
-        
-        candidate_max_level = 0
-        for edu in candidate_education:
-            for level_name, level_value in education_levels.items():
-                if level_name in edu:
-                    candidate_max_level = max(candidate_max_level, level_value)
-        
-        if candidate_max_level >= required_level:
-            return 100.0
-        else:
-            return (candidate_max_level / required_level) * 100
-    
     def _generate_detailed_analysis(self, candidate, job_req, skill_score, experience_score, culture_score, education_score) -> Dict[str, str]:
         """詳細分析を生成"""
         analysis = {
@@ -381,7 +517,9 @@ class CandidateMatcher:
         }
         
         # スキル分析詳細
-        matched_skills = [skill for skill in job_req.required_skills if skill in candidate.skills]
+        # 共通部分は集合演算で求め、表示は求人に記載された表記・順序で行う
+        matched_keys = job_req.required_skills_set & candidate.skills_set
+        matched_skills = [skill for skill in job_req.required_skills if skill_key(skill) in matched_keys] if matched_keys else []
         if matched_skills:
             analysis["skill_analysis"] += f"適合スキル: {', '.join(matched_skills)}"
         else:
@@ -424,6 +562,84 @@ class CandidateMatcher:
         
         return focus_areas
 
+# プロセスごとに1つだけ生成する履歴書分析器（プール内のタスク間で使い回す）
+_shared_analyzer: Optional[ResumeAnalyzer] = None
+
+def get_shared_analyzer() -> ResumeAnalyzer:
+    """プロセス内で共有する ResumeAnalyzer を取得（初回のみ生成）"""
+    global _shared_analyzer
+    if _shared_analyzer is None:
+        _shared_analyzer = ResumeAnalyzer()
+    return _shared_analyzer
+
+def _extract_shared_profile(resume_text: str) -> CandidateProfile:
+    """プロセスプールのワーカーで履歴書1件を抽出（ワーカー内の分析器を使い回す）"""
+    return get_shared_analyzer()._extract_candidate_profile(resume_text)
+
+def analyze_candidate(task: Tuple[str, JobRequirement, CompanyProfile]) -> Tuple[CandidateProfile, MatchingResult]:
+    """
+    履歴書1件を分析してマッチング評価を行う
+
+    プロセスプールから呼び出せるようにモジュールトップレベルに定義
+    """
+    resume_text, job_req, company_profile = task
+    candidate = get_shared_analyzer().extract_candidate_profile(resume_text)
+    matching_result = CandidateMatcher(company_profile).calculate_match_score(candidate, job_req)
+    return candidate, matching_result
+
+def analyze_candidates_batch(tasks: List[Tuple[str, JobRequirement, CompanyProfile]],
+                             max_workers: Optional[int] = None,
+                             show_progress: bool = False,
+                             executor: Optional[Executor] = None) -> Tuple[List[Optional[Tuple[CandidateProfile, MatchingResult]]], Dict[int, str]]:
+    """
+    複数の履歴書をプロセスプールで並列に分析
+
+    結果は入力と同じ順序で返し、失敗した履歴書は None とした上で
+    インデックスとエラー内容を failures に記録する（他の履歴書の処理は継続）
+
+    executor を渡した場合はそのプールで処理する（呼び出し側で使い回すもので、ここでは終了しない）。
+    渡さない場合は BATCH_PARALLEL_MIN 件以上かつ2プロセス以上使えるときだけ、件数を上限とした
+    プールをこの呼び出しの間だけ起動する（max_workers=1 なら常に逐次処理）。
+    プール自体が使えなくなった場合（BrokenExecutor）は失敗として記録せずに送出する
+    """
+    results: List[Optional[Tuple[CandidateProfile, MatchingResult]]] = [None] * len(tasks)
+    failures: Dict[int, str] = {}
+    if not tasks:
+        return results, failures
+
+    own_executor = None
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if executor is None and len(tasks) >= BATCH_PARALLEL_MIN and workers > 1:
+        try:
+            own_executor = executor = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError) as e:
+            # マルチプロセスが使えない環境（サーバーレス等）では逐次処理
+            logger.warning(f"プロセスプールを利用できないため逐次処理します: {e}")
+
+    def collect(index, get_result):
+        try:
+            results[index] = get_result()
+        except BrokenExecutor:
+            raise
+        except Exception as e:
+            failures[index] = str(e)
+        if show_progress:
+            logger.info(f"一括分析: {index + 1}/{len(tasks)} 件完了")
+
+    if executor is None:
+        for index, task in enumerate(tasks):
+            collect(index, lambda task=task: analyze_candidate(task))
+    else:
+        try:
+            futures = [executor.submit(analyze_candidate, task) for task in tasks]
+            for index, future in enumerate(futures):
+                collect(index, future.result)
+        finally:
+            if own_executor is not None:
+                own_executor.shutdown()
+
+    return results, failures
+
 def main():
     """メイン処理"""
     logger.info("AI採用支援システムを起動しています...")
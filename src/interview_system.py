@@ -4,8 +4,9 @@
 1次面接・2次面接に対応した質問とスキル評価を自動生成
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Dict, Iterator, Mapping, Optional, Tuple, Union
 from enum import Enum
 import json
 import random
@@ -31,46 +32,368 @@ class SkillCategory(Enum):
     CREATIVITY = "創造性"
     WORK_ETHIC = "職業倫理"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterviewQuestion:
     """面接質問"""
     id: str
     category: SkillCategory
     stage: InterviewStage
     question: str
-    follow_up_questions: List[str]
-    evaluation_points: List[str]
+    follow_up_questions: Tuple[str, ...]
+    evaluation_points: Tuple[str, ...]
     good_answer_example: str
-    red_flags: List[str]
+    red_flags: Tuple[str, ...]
     time_limit_minutes: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvaluationCriteria:
     """評価基準"""
     skill_category: SkillCategory
     criteria_name: str
     description: str
-    evaluation_levels: Dict[str, str]  # レベル（1-5）と説明
+    evaluation_levels: Mapping[str, str]  # レベル（1-5）と説明
     weight: float  # 重み（0.1-1.0）
+    # 整数スコアをキーにしたレベル説明（evaluation_levels から生成）
+    evaluation_levels_int: Mapping[int, str] = field(init=False, repr=False, compare=False)
+    # テンプレート内の位置（InterviewResult.evaluations の添字、テンプレート生成時に採番）
+    idx: int = field(init=False, default=-1, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        # テンプレートは全ての面接計画で共有されるため、読み取り専用のビューとして保持する
+        object.__setattr__(self, 'evaluation_levels', MappingProxyType(dict(self.evaluation_levels)))
+        object.__setattr__(self, 'evaluation_levels_int', MappingProxyType(
+            {int(level): desc for level, desc in self.evaluation_levels.items()}))
+
+@dataclass(slots=True, frozen=True)
 class InterviewPlan:
     """面接計画"""
     candidate_name: str
     position: str
     stage: InterviewStage
     duration_minutes: int
-    questions: List[InterviewQuestion]
-    evaluation_criteria: List[EvaluationCriteria]
-    focus_areas: List[str]
-    special_notes: List[str]
+    questions: Tuple[InterviewQuestion, ...]
+    evaluation_criteria: Tuple[EvaluationCriteria, ...]
+    focus_areas: Tuple[str, ...]
+    special_notes: Tuple[str, ...]
+
+# 質問テンプレート（不変の定数としてモジュール読み込み時に1回だけ生成）
+_QUESTION_TEMPLATES: Dict[str, Tuple[InterviewQuestion, ...]] = {
+    "technical_questions": (
+        InterviewQuestion(
+            id="tech_001",
+            category=SkillCategory.TECHNICAL,
+            stage=InterviewStage.FIRST,
+            question="これまでの開発経験で最も技術的に困難だったプロジェクトについて教えてください。どのような課題があり、どう解決しましたか？",
+            follow_up_questions=(
+                "その技術選択の理由は何でしたか？",
+                "他の選択肢は検討しましたか？",
+                "結果的に最適な選択だったと思いますか？"
+            ),
+            evaluation_points=(
+                "技術的な深い理解があるか",
+                "問題解決のアプローチが論理的か",
+                "技術選択の判断力があるか",
+                "学習意欲・継続的改善の姿勢があるか"
+            ),
+            good_answer_example="具体的な技術課題を明確に説明し、複数の解決策を検討した上で選択理由を論理的に説明できる",
+            red_flags=(
+                "技術的な詳細を説明できない",
+                "問題の本質を理解していない",
+                "他者任せの解決方法しか提示しない"
+            ),
+            time_limit_minutes=10
+        ),
+
+        InterviewQuestion(
+            id="tech_002",
+            category=SkillCategory.TECHNICAL,
+            stage=InterviewStage.SECOND,
+            question="コードレビューで指摘されることが多い項目は何ですか？また、それをどう改善していますか？",
+            follow_up_questions=(
+                "チーム内でのコードレビュー文化はどうでしたか？",
+                "コードの品質を保つために普段心がけていることは？",
+                "新しい技術やライブラリを導入する際の判断基準は？"
+            ),
+            evaluation_points=(
+                "自己省察能力があるか",
+                "コード品質への意識があるか",
+                "チーム開発への理解があるか",
+                "継続的な改善意識があるか"
+            ),
+            good_answer_example="具体的な改善例を示し、チーム全体のコード品質向上に貢献した経験がある",
+            red_flags=(
+                "指摘されたことがないと回答",
+                "改善意識が見られない",
+                "他人のせいにする発言"
+            ),
+            time_limit_minutes=8
+        ),
+    ),
+
+    "communication_questions": (
+        InterviewQuestion(
+            id="comm_001",
+            category=SkillCategory.COMMUNICATION,
+            stage=InterviewStage.FIRST,
+            question="技術的でない方（営業や企画など）に対して、複雑な技術内容を説明した経験はありますか？その時に工夫したことを教えてください。",
+            follow_up_questions=(
+                "相手の理解度をどう確認していましたか？",
+                "説明が伝わらなかった場合、どう対応しましたか？",
+                "資料やツールは活用しましたか？"
+            ),
+            evaluation_points=(
+                "相手の立場に立って考えられるか",
+                "分かりやすい説明ができるか",
+                "コミュニケーションスキルがあるか",
+                "柔軟な対応力があるか"
+            ),
+            good_answer_example="相手のレベルに合わせて説明方法を変え、理解を確認しながら進めることができる",
+            red_flags=(
+                "専門用語ばかりで説明する",
+                "相手の反応を見ない",
+                "一方的な説明に終始"
+            ),
+            time_limit_minutes=7
+        ),
+
+        InterviewQuestion(
+            id="comm_002",
+            category=SkillCategory.COMMUNICATION,
+            stage=InterviewStage.SECOND,
+            question="チーム内で意見が対立した際、どのように解決に導いた経験がありますか？",
+            follow_up_questions=(
+                "対立の原因は何でしたか？",
+                "あなたが取った具体的な行動は？",
+                "結果はどうなりましたか？学んだことは？"
+            ),
+            evaluation_points=(
+                "対立を建設的に解決できるか",
+                "冷静な判断力があるか",
+                "チームの調和を重視するか",
+                "リーダーシップの素質があるか"
+            ),
+            good_answer_example="双方の意見を整理し、共通の目標に向けて合意形成を図ることができる",
+            red_flags=(
+                "対立を避ける姿勢",
+                "一方的な主張のみ",
+                "感情的な対応"
+            ),
+            time_limit_minutes=10
+        ),
+    ),
+
+    "leadership_questions": (
+        InterviewQuestion(
+            id="lead_001",
+            category=SkillCategory.LEADERSHIP,
+            stage=InterviewStage.SECOND,
+            question="プロジェクトでリーダーシップを発揮した経験について具体的に教えてください。チームのモチベーション維持や目標達成のために何を行いましたか？",
+            follow_up_questions=(
+                "チームメンバーの個性をどう把握していましたか？",
+                "困難な状況でのチームマネジメントは？",
+                "失敗した場合の責任の取り方は？"
+            ),
+            evaluation_points=(
+                "リーダーとしての責任感があるか",
+                "チームメンバーを適切に動機づけられるか",
+                "目標達成への戦略的思考があるか",
+                "困難な状況での判断力があるか"
+            ),
+            good_answer_example="メンバーの強みを活かしながら、明確な目標設定と進捗管理でチームを成功に導いた",
+            red_flags=(
+                "指示だけのマネジメント",
+                "メンバーへの配慮不足",
+                "責任転嫁の傾向"
+            ),
+            time_limit_minutes=12
+        ),
+    ),
+
+    "problem_solving_questions": (
+        InterviewQuestion(
+            id="prob_001",
+            category=SkillCategory.PROBLEM_SOLVING,
+            stage=InterviewStage.FIRST,
+            question="予期しない障害やバグが発生した時の対応プロセスを教えてください。最近経験した具体例があれば併せてお聞かせください。",
+            follow_up_questions=(
+                "原因特定のためのアプローチは？",
+                "ステークホルダーへの報告・連絡は？",
+                "再発防止のための対策は？"
+            ),
+            evaluation_points=(
+                "論理的な問題解決ができるか",
+                "冷静な状況判断ができるか",
+                "適切な報連相ができるか",
+                "予防的思考があるか"
+            ),
+            good_answer_example="体系的なアプローチで原因を特定し、適切な報告と迅速な解決を実現できる",
+            red_flags=(
+                "場当たり的な対応",
+                "報告を怠る",
+                "原因分析が浅い"
+            ),
+            time_limit_minutes=8
+        ),
+    )
+}
+
+def _index_questions(templates: Dict[str, Tuple[InterviewQuestion, ...]]) -> Dict[Tuple[InterviewStage, SkillCategory], Tuple[InterviewQuestion, ...]]:
+    """質問テンプレートを (面接ステージ, スキルカテゴリ) ごとにまとめる（テンプレートの定義順を保つ）"""
+    index: Dict[Tuple[InterviewStage, SkillCategory], List[InterviewQuestion]] = {}
+    for questions in templates.values():
+        for question in questions:
+            index.setdefault((question.stage, question.category), []).append(question)
+    return {key: tuple(questions) for key, questions in index.items()}
+
+# (面接ステージ, スキルカテゴリ) → 該当する質問
+_QUESTIONS_BY_STAGE_CATEGORY = _index_questions(_QUESTION_TEMPLATES)
+
+# 評価基準テンプレート（同上）
+_EVALUATION_CRITERIA: Tuple[EvaluationCriteria, ...] = (
+    EvaluationCriteria(
+        skill_category=SkillCategory.TECHNICAL,
+        criteria_name="技術的専門知識",
+        description="職務に必要な技術スキルの深さと幅",
+        evaluation_levels={
+            "5": "優秀 - 専門分野で高度な知識を持ち、新技術への適応も早い",
+            "4": "良好 - 必要な技術スキルを十分に持ち、実践的に活用できる",
+            "3": "普通 - 基本的な技術スキルは持っているが、応用力に課題",
+            "2": "要改善 - 技術スキルが不足しており、研修が必要",
+            "1": "不適合 - 技術的な理解が乏しく、職務遂行が困難"
+        },
+        weight=0.3
+    ),
+
+    EvaluationCriteria(
+        skill_category=SkillCategory.COMMUNICATION,
+        criteria_name="コミュニケーション能力",
+        description="口頭・文章での意思疎通の効果性",
+        evaluation_levels={
+            "5": "優秀 - 相手に応じた効果的なコミュニケーションができる",
+            "4": "良好 - 明確で分かりやすいコミュニケーションができる",
+            "3": "普通 - 基本的なコミュニケーションはできるが、改善の余地あり",
+            "2": "要改善 - コミュニケーションに課題があり、誤解を生じやすい",
+            "1": "不適合 - コミュニケーション能力が著しく不足"
+        },
+        weight=0.25
+    ),
+
+    EvaluationCriteria(
+        skill_category=SkillCategory.PROBLEM_SOLVING,
+        criteria_name="問題解決能力",
+        description="課題の発見・分析・解決の能力",
+        evaluation_levels={
+            "5": "優秀 - 複雑な問題も体系的に分析し、創造的な解決策を提示",
+            "4": "良好 - 論理的思考で問題を解決できる",
+            "3": "普通 - 基本的な問題解決はできるが、複雑な課題には支援が必要",
+            "2": "要改善 - 問題解決のアプローチが不十分",
+            "1": "不適合 - 問題解決能力が不足"
+        },
+        weight=0.2
+    ),
+
+    EvaluationCriteria(
+        skill_category=SkillCategory.TEAMWORK,
+        criteria_name="チームワーク",
+        description="チーム内での協調性と貢献度",
+        evaluation_levels={
+            "5": "優秀 - チームの結束を高め、メンバーのパフォーマンス向上に貢献",
+            "4": "良好 - チームでの協働が得意で、信頼関係を築ける",
+            "3": "普通 - チームでの作業はできるが、積極性に欠ける",
+            "2": "要改善 - チームワークに課題があり、協調性を高める必要",
+            "1": "不適合 - チームでの作業に支障をきたす"
+        },
+        weight=0.15
+    ),
+
+    EvaluationCriteria(
+        skill_category=SkillCategory.ADAPTABILITY,
+        criteria_name="適応力・学習意欲",
+        description="変化への対応力と継続的な学習姿勢",
+        evaluation_levels={
+            "5": "優秀 - 変化を積極的に受け入れ、継続的にスキルアップしている",
+            "4": "良好 - 新しい環境や技術に適応でき、学習意欲も高い",
+            "3": "普通 - 基本的な適応力はあるが、積極性に欠ける",
+            "2": "要改善 - 変化への対応が苦手で、学習意欲も低い",
+            "1": "不適合 - 適応力が著しく不足"
+        },
+        weight=0.1
+    ),
+)
+
+def _assign_criteria_indexes(criteria: Tuple[EvaluationCriteria, ...]) -> Dict[str, int]:
+    """評価基準に通し番号を振り、評価基準名 → 番号の対応を返す"""
+    for idx, c in enumerate(criteria):
+        object.__setattr__(c, 'idx', idx)
+    return {c.criteria_name: c.idx for c in criteria}
+
+# InterviewResult.evaluations で未評価を表すスコア
+UNSCORED = -1
+
+# 評価基準名 → InterviewResult.evaluations の添字
+_CRITERIA_INDEX = _assign_criteria_indexes(_EVALUATION_CRITERIA)
+
+def _criteria_for(*categories: SkillCategory) -> Tuple[EvaluationCriteria, ...]:
+    """指定カテゴリの評価基準をテンプレート順に抽出"""
+    wanted = frozenset(categories)
+    return tuple(c for c in _EVALUATION_CRITERIA if c.skill_category in wanted)
+
+# 1次面接：基本スキルと適性
+_CRITERIA_FIRST = _criteria_for(SkillCategory.TECHNICAL, SkillCategory.COMMUNICATION, SkillCategory.PROBLEM_SOLVING)
+# 2次面接：総合的な評価
+_CRITERIA_SECOND = _EVALUATION_CRITERIA
+# 最終面接：文化適合性と意欲
+_CRITERIA_FINAL = _criteria_for(SkillCategory.ADAPTABILITY, SkillCategory.WORK_ETHIC, SkillCategory.TEAMWORK)
+
+# 面接ステージ → 重点評価項目
+_CRITERIA_BY_STAGE: Dict[InterviewStage, Tuple[EvaluationCriteria, ...]] = {
+    InterviewStage.FIRST: _CRITERIA_FIRST,
+    InterviewStage.SECOND: _CRITERIA_SECOND,
+    InterviewStage.FINAL: _CRITERIA_FINAL,
+}
+
+# ステージ別の面接時間（分）
+_DURATION_BY_STAGE: Dict[InterviewStage, int] = {
+    InterviewStage.FIRST: 60,   # 1次面接: 60分
+    InterviewStage.SECOND: 90,  # 2次面接: 90分
+    InterviewStage.FINAL: 45    # 最終面接: 45分
+}
+
+# ステージ別の基本質問数（カテゴリ, 質問数）の選択順
+_QUESTION_COUNTS_BY_STAGE: Dict[InterviewStage, Tuple[Tuple[SkillCategory, int], ...]] = {
+    InterviewStage.FIRST: (
+        (SkillCategory.TECHNICAL, 3),
+        (SkillCategory.COMMUNICATION, 2),
+        (SkillCategory.PROBLEM_SOLVING, 2),
+    ),
+    InterviewStage.SECOND: (
+        (SkillCategory.TECHNICAL, 2),
+        (SkillCategory.LEADERSHIP, 2),
+        (SkillCategory.TEAMWORK, 2),
+        (SkillCategory.COMMUNICATION, 1),
+    ),
+    InterviewStage.FINAL: (
+        (SkillCategory.WORK_ETHIC, 2),
+        (SkillCategory.ADAPTABILITY, 1),
+        (SkillCategory.CREATIVITY, 1),
+    ),
+}
+
+# 特記事項の定型文
+_NOTE_LOW_SKILL = "⚠️ 技術スキルが要件を大きく下回っています。具体的な経験と学習意欲を重点的に確認してください。"
+_NOTE_LOW_EXPERIENCE = "⚠️ 経験年数が不足しています。実務経験の質と学習能力を詳しく評価してください。"
+_NOTE_HIGH_OVERALL = "✅ 総合的に高い評価です。より高度な責任を任せられる可能性があります。"
+_NOTE_ENGLISH = "📝 英語スキルがあります。グローバルプロジェクトへの参加可能性を確認してください。"
+_NOTE_CERTIFICATIONS = "📝 取得資格: {}。学習意欲と専門性を評価してください。"
 
 class InterviewQuestionGenerator:
     """面接質問生成システム"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.question_templates = self._initialize_question_templates()
         self.evaluation_criteria_templates = self._initialize_evaluation_criteria()
+        # 質問選択用の乱数生成器（インスタンスごとに持ち、スレッド間でグローバルな random を共有しない）
+        self._rng = random.Random(seed)
     
     def generate_interview_plan(self, candidate: CandidateProfile, job_req: JobRequirement, 
                               matching_result: MatchingResult, stage: InterviewStage) -> InterviewPlan:
@@ -78,16 +401,10 @@ class InterviewQuestionGenerator:
         候補者の特性と求人要件に基づいて面接計画を生成
         """
         # ステージに応じた面接時間設定
-        duration_map = {
-            InterviewStage.FIRST: 60,   # 1次面接: 60分
-            InterviewStage.SECOND: 90,  # 2次面接: 90分
-            InterviewStage.FINAL: 45    # 最終面接: 45分
-        }
-        
-        duration = duration_map[stage]
+        duration = _DURATION_BY_STAGE[stage]
         
         # 質問選択
-        questions = self._select_questions(candidate, job_req, matching_result, stage)
+        questions = tuple(self._select_questions(candidate, job_req, matching_result, stage))
         
         # 評価基準選択
         evaluation_criteria = self._select_evaluation_criteria(job_req, stage)
@@ -105,317 +422,41 @@ class InterviewQuestionGenerator:
             duration_minutes=duration,
             questions=questions,
             evaluation_criteria=evaluation_criteria,
-            focus_areas=focus_areas,
-            special_notes=special_notes
+            focus_areas=tuple(focus_areas),
+            special_notes=tuple(special_notes)
         )
     
-    def _initialize_question_templates(self) -> Dict[str, List[InterviewQuestion]]:
-        """質問テンプレートを初期化"""
-        templates = {
-            "technical_questions": [
-                InterviewQuestion(
-                    id="tech_001",
-                    category=SkillCategory.TECHNICAL,
-                    stage=InterviewStage.FIRST,
-                    question="これまでの開発経験で最も技術的に困難だったプロジェクトについて教えてください。どのような課題があり、どう解決しましたか？",
-                    follow_up_questions=[
-                        "その技術選択の理由は何でしたか？",
-                        "他の選択肢は検討しましたか？",
-                        "結果的に最適な選択だったと思いますか？"
-                    ],
-                    evaluation_points=[
-                        "技術的な深い理解があるか",
-                        "問題解決のアプローチが論理的か",
-                        "技術選択の判断力があるか",
-                        "学習意欲・継続的改善の姿勢があるか"
-                    ],
-                    good_answer_example="具体的な技術課題を明確に説明し、複数の解決策を検討した上で選択理由を論理的に説明できる",
-                    red_flags=[
-                        "技術的な詳細を説明できない",
-                        "問題の本質を理解していない",
-                        "他者任せの解決方法しか提示しない"
-                    ],
-                    time_limit_minutes=10
-                ),
-                
-                InterviewQuestion(
-                    id="tech_002",
-                    category=SkillCategory.TECHNICAL,
-                    stage=InterviewStage.SECOND,
-                    question="コードレビューで指摘されることが多い項目は何ですか？また、それをどう改善していますか？",
-                    follow_up_questions=[
-                        "チーム内でのコードレビュー文化はどうでしたか？",
-                        "コードの品質を保つために普段心がけていることは？",
-                        "新しい技術やライブラリを導入する際の判断基準は？"
-                    ],
-                    evaluation_points=[
-                        "自己省察能力があるか",
-                        "コード品質への意識があるか",
-                        "チーム開発への理解があるか",
-                        "継続的な改善意識があるか"
-                    ],
-                    good_answer_example="具体的な改善例を示し、チーム全体のコード品質向上に貢献した経験がある",
-                    red_flags=[
-                        "指摘されたことがないと回答",
-                        "改善意識が見られない",
-                        "他人のせいにする発言"
-                    ],
-                    time_limit_minutes=8
-                )
-            ],
-            
-            "communication_questions": [
-                InterviewQuestion(
-                    id="comm_001",
-                    category=SkillCategory.COMMUNICATION,
-                    stage=InterviewStage.FIRST,
-                    question="技術的でない方（営業や企画など）に対して、複雑な技術内容を説明した経験はありますか？その時に工夫したことを教えてください。",
-                    follow_up_questions=[
-                        "相手の理解度をどう確認していましたか？",
-                        "説明が伝わらなかった場合、どう対応しましたか？",
-                        "資料やツールは活用しましたか？"
-                    ],
-                    evaluation_points=[
-                        "相手の立場に立って考えられるか",
-                        "分かりやすい説明ができるか",
-                        "コミュニケーションスキルがあるか",
-                        "柔軟な対応力があるか"
-                    ],
-                    good_answer_example="相手のレベルに合わせて説明方法を変え、理解を確認しながら進めることができる",
-                    red_flags=[
-                        "専門用語ばかりで説明する",
-                        "相手の反応を見ない",
-                        "一方的な説明に終始"
-                    ],
-                    time_limit_minutes=7
-                ),
-                
-                InterviewQuestion(
-                    id="comm_002",
-                    category=SkillCategory.COMMUNICATION,
-                    stage=InterviewStage.SECOND,
-                    question="チーム内で意見が対立した際、どのように解決に導いた経験がありますか？",
-                    follow_up_questions=[
-                        "対立の原因は何でしたか？",
-                        "あなたが取った具体的な行動は？",
-                        "結果はどうなりましたか？学んだことは？"
-                    ],
-                    evaluation_points=[
-                        "対立を建設的に解決できるか",
-                        "冷静な判断力があるか",
-                        "チームの調和を重視するか",
-                        "リーダーシップの素質があるか"
-                    ],
-                    good_answer_example="双方の意見を整理し、共通の目標に向けて合意形成を図ることができる",
-                    red_flags=[
-                        "対立を避ける姿勢",
-                        "一方的な主張のみ",
-                        "感情的な対応"
-                    ],
-                    time_limit_minutes=10
-                )
-            ],
-            
-            "leadership_questions": [
-                InterviewQuestion(
-                    id="lead_001",
-                    category=SkillCategory.LEADERSHIP,
-                    stage=InterviewStage.SECOND,
-                    question="プロジェクトでリーダーシップを発揮した経験について具体的に教えてください。チームのモチベーション維持や目標達成のために何を行いましたか？",
-                    follow_up_questions=[
-                        "チームメンバーの個性をどう把握していましたか？",
-                        "困難な状況でのチームマネジメントは？",
-                        "失敗した場合の責任の取り方は？"
-                    ],
-                    evaluation_points=[
-                        "リーダーとしての責任感があるか",
-                        "チームメンバーを適切に動機づけられるか",
-                        "目標達成への戦略的思考があるか",
-                        "困難な状況での判断力があるか"
-                    ],
-                    good_answer_example="メンバーの強みを活かしながら、明確な目標設定と進捗管理でチームを成功に導いた",
-                    red_flags=[
-                        "指示だけのマネジメント",
-                        "メンバーへの配慮不足",
-                        "責任転嫁の傾向"
-                    ],
-                    time_limit_minutes=12
-                )
-            ],
-            
-            "problem_solving_questions": [
-                InterviewQuestion(
-                    id="prob_001",
-                    category=SkillCategory.PROBLEM_SOLVING,
-                    stage=InterviewStage.FIRST,
-                    question="予期しない障害やバグが発生した時の対応プロセスを教えてください。最近経験した具体例があれば併せてお聞かせください。",
-                    follow_up_questions=[
-                        "原因特定のためのアプローチは？",
-                        "ステークホルダーへの報告・連絡は？",
-                        "再発防止のための対策は？"
-                    ],
-                    evaluation_points=[
-                        "論理的な問題解決ができるか",
-                        "冷静な状況判断ができるか",
-                        "適切な報連相ができるか",
-                        "予防的思考があるか"
-                    ],
-                    good_answer_example="体系的なアプローチで原因を特定し、適切な報告と迅速な解決を実現できる",
-                    red_flags=[
-                        "場当たり的な対応",
-                        "報告を怠る",
-                        "原因分析が浅い"
-                    ],
-                    time_limit_minutes=8
-                )
-            ]
-        }
-        
-        return templates
+    def _initialize_question_templates(self) -> Dict[str, Tuple[InterviewQuestion, ...]]:
+        """質問テンプレートを取得（モジュール定数を共有）"""
+        return _QUESTION_TEMPLATES
     
-    def _initialize_evaluation_criteria(self) -> List[EvaluationCriteria]:
-        """評価基準テンプレートを初期化"""
-        criteria = [
-            EvaluationCriteria(
-                skill_category=SkillCategory.TECHNICAL,
-                criteria_name="技術的専門知識",
-                description="職務に必要な技術スキルの深さと幅",
-                evaluation_levels={
-                    "5": "優秀 - 専門分野で高度な知識を持ち、新技術への適応も早い",
-                    "4": "良好 - 必要な技術スキルを十分に持ち、実践的に活用できる",
-                    "3": "普通 - 基本的な技術スキルは持っているが、応用力に課題",
-                    "2": "要改善 - 技術スキルが不足しており、研修が必要",
-                    "1": "不適合 - 技術的な理解が乏しく、職務遂行が困難"
-                },
-                weight=0.3
-            ),
-            
-            EvaluationCriteria(
-                skill_category=SkillCategory.COMMUNICATION,
-                criteria_name="コミュニケーション能力",
-                description="口頭・文章での意思疎通の効果性",
-                evaluation_levels={
-                    "5": "優秀 - 相手に応じた効果的なコミュニケーションができる",
-                    "4": "良好 - 明確で分かりやすいコミュニケーションができる",
-                    "3": "普通 - 基本的なコミュニケーションはできるが、改善の余地あり",
-                    "2": "要改善 - コミュニケーションに課題があり、誤解を生じやすい",
-                    "1": "不適合 - コミュニケーション能力が著しく不足"
-                },
-                weight=0.25
-            ),
-            
-            EvaluationCriteria(
-                skill_category=SkillCategory.PROBLEM_SOLVING,
-                criteria_name="問題解決能力",
-                description="課題の発見・分析・解決の能力",
-                evaluation_levels={
-                    "5": "優秀 - 複雑な問題も体系的に分析し、創造的な解決策を提示",
-                    "4": "良好 - 論理的思考で問題を解決できる",
-                    "3": "普通 - 基本的な問題解決はできるが、複雑な課題には支援が必要",
-                    "2": "要改善 - 問題解決のアプローチが不十分",
-                    "1": "不適合 - 問題解決能力が不足"
-                },
-                weight=0.2
-            ),
-            
-            EvaluationCriteria(
-                skill_category=SkillCategory.TEAMWORK,
-                criteria_name="チームワーク",
-                description="チーム内での協調性と貢献度",
-                evaluation_levels={
-                    "5": "優秀 - チームの結束を高め、メンバーのパフォーマンス向上に貢献",
-                    "4": "良好 - チームでの協働が得意で、信頼関係を築ける",
-                    "3": "普通 - チームでの作業はできるが、積極性に欠ける",
-                    "2": "要改善 - チームワークに課題があり、協調性を高める必要",
-                    "1": "不適合 - チームでの作業に支障をきたす"
-                },
-                weight=0.15
-            ),
-            
-            EvaluationCriteria(
-                skill_category=SkillCategory.ADAPTABILITY,
-                criteria_name="適応力・学習意欲",
-                description="変化への対応力と継続的な学習姿勢",
-                evaluation_levels={
-                    "5": "優秀 - 変化を積極的に受け入れ、継続的にスキルアップしている",
-                    "4": "良好 - 新しい環境や技術に適応でき、学習意欲も高い",
-                    "3": "普通 - 基本的な適応力はあるが、積極性に欠ける",
-                    "2": "要改善 - 変化への対応が苦手で、学習意欲も低い",
-                    "1": "不適合 - 適応力が著しく不足"
-                },
-                weight=0.1
-            )
-        ]
-        
-        return criteria
+    def _initialize_evaluation_criteria(self) -> Tuple[EvaluationCriteria, ...]:
+        """評価基準テンプレートを取得（モジュール定数を共有）"""
+        return _EVALUATION_CRITERIA
     
     def _select_questions(self, candidate: CandidateProfile, job_req: JobRequirement, 
-                         matching_result: MatchingResult, stage: InterviewStage) -> List[InterviewQuestion]:
-        """候補者と求人要件に基づいて質問を選択"""
-        selected_questions = []
-        
-        # ステージ別の基本質問数
-        question_counts = {
-            InterviewStage.FIRST: {
-                SkillCategory.TECHNICAL: 3,
-                SkillCategory.COMMUNICATION: 2,
-                SkillCategory.PROBLEM_SOLVING: 2
-            },
-            InterviewStage.SECOND: {
-                SkillCategory.TECHNICAL: 2,
-                SkillCategory.LEADERSHIP: 2,
-                SkillCategory.TEAMWORK: 2,
-                SkillCategory.COMMUNICATION: 1
-            },
-            InterviewStage.FINAL: {
-                SkillCategory.WORK_ETHIC: 2,
-                SkillCategory.ADAPTABILITY: 1,
-                SkillCategory.CREATIVITY: 1
-            }
-        }
-        
-        target_counts = question_counts.get(stage, {})
+                         matching_result: MatchingResult, stage: InterviewStage) -> Iterator[InterviewQuestion]:
+        """候補者と求人要件に基づいて質問を選択（カテゴリ順に逐次返す）"""
+        # 候補者の弱点に基づいて追加質問を選択（技術スキルが不足している場合は質問を増やす）
+        extra_technical = matching_result.skill_match_score < 70
+        technical = SkillCategory.TECHNICAL
+        sample = self._rng.sample
         
         # 各カテゴリから質問を選択
-        for category, count in target_counts.items():
-            available_questions = []
+        for category, count in _QUESTION_COUNTS_BY_STAGE.get(stage, ()):
+            # 該当カテゴリの質問
+            available_questions = _QUESTIONS_BY_STAGE_CATEGORY.get((stage, category), ())
             
-            # 該当カテゴリの質問を収集
-            for question_group in self.question_templates.values():
-                available_questions.extend([q for q in question_group if q.category == category and q.stage == stage])
-            
-            # 候補者の弱点に基づいて追加質問を選択
-            if category == SkillCategory.TECHNICAL and matching_result.skill_match_score < 70:
-                count += 1  # 技術スキルが不足している場合は質問を増やす
+            if extra_technical and category is technical:
+                count += 1
             
             # ランダムに質問を選択
-            selected = random.sample(available_questions, min(count, len(available_questions)))
-            selected_questions.extend(selected)
-        
-        return selected_questions
+            yield from sample(available_questions, min(count, len(available_questions)))
     
-    def _select_evaluation_criteria(self, job_req: JobRequirement, stage: InterviewStage) -> List[EvaluationCriteria]:
+    def _select_evaluation_criteria(self, job_req: JobRequirement, stage: InterviewStage) -> Tuple[EvaluationCriteria, ...]:
         """ステージと職種に基づいて評価基準を選択"""
-        all_criteria = self._initialize_evaluation_criteria()
-        
-        # ステージ別の重点評価項目
-        if stage == InterviewStage.FIRST:
-            # 1次面接：基本スキルと適性
-            return [c for c in all_criteria if c.skill_category in [
-                SkillCategory.TECHNICAL, 
-                SkillCategory.COMMUNICATION, 
-                SkillCategory.PROBLEM_SOLVING
-            ]]
-        elif stage == InterviewStage.SECOND:
-            # 2次面接：総合的な評価
-            return all_criteria
-        else:
-            # 最終面接：文化適合性と意欲
-            return [c for c in all_criteria if c.skill_category in [
-                SkillCategory.ADAPTABILITY,
-                SkillCategory.WORK_ETHIC,
-                SkillCategory.TEAMWORK
-            ]]
+        # ステージ別の重点評価項目（モジュール読み込み時に抽出済み、不変なのでそのまま共有）
+        return _CRITERIA_BY_STAGE[stage]
     
     def _generate_special_notes(self, candidate: CandidateProfile, matching_result: MatchingResult) -> List[str]:
         """特記事項を生成"""
@@ -423,28 +464,28 @@ class InterviewQuestionGenerator:
         
         # スキルマッチ度に基づく注意事項
         if matching_result.skill_match_score < 60:
-            notes.append("⚠️ 技術スキルが要件を大きく下回っています。具体的な経験と学習意欲を重点的に確認してください。")
+            notes.append(_NOTE_LOW_SKILL)
         
         # 経験年数に基づく注意事項
         if matching_result.experience_match_score < 70:
-            notes.append("⚠️ 経験年数が不足しています。実務経験の質と学習能力を詳しく評価してください。")
+            notes.append(_NOTE_LOW_EXPERIENCE)
         
         # 強みに基づくポジティブな注記
         if matching_result.overall_score > 85:
-            notes.append("✅ 総合的に高い評価です。より高度な責任を任せられる可能性があります。")
+            notes.append(_NOTE_HIGH_OVERALL)
         
         # 特定スキルに基づく注記
-        if "英語" in candidate.languages:
-            notes.append("📝 英語スキルがあります。グローバルプロジェクトへの参加可能性を確認してください。")
+        if "英語" in candidate.languages_set:
+            notes.append(_NOTE_ENGLISH)
         
         # 資格に基づる注記
         if candidate.certifications:
-            notes.append(f"📝 取得資格: {', '.join(candidate.certifications)}。学習意欲と専門性を評価してください。")
+            notes.append(_NOTE_CERTIFICATIONS.format(', '.join(candidate.certifications)))
         
         return notes
 
 # 面接結果記録システム
-@dataclass
+@dataclass(slots=True)
 class InterviewResult:
     """面接結果"""
     candidate_name: str
@@ -453,7 +494,9 @@ class InterviewResult:
     date: str
     duration_minutes: int
     questions_asked: List[str]
-    evaluations: Dict[str, int]  # 評価項目ごとのスコア（1-5）
+    # 評価基準の idx 順のスコア（1-5、未評価は UNSCORED）。evaluation_scores で作成する。
+    # 従来の 評価基準名 → スコア の辞書も受け付ける
+    evaluations: Union[List[int], Dict[str, int]]
     overall_impression: str
     strengths: List[str]
     concerns: List[str]
@@ -461,9 +504,30 @@ class InterviewResult:
     next_steps: List[str]
     additional_notes: str
 
+# 面接レポートの固定見出し（値を含まない部分は定数として一度だけ生成）
+_REPORT_STRENGTHS_HEADING = "\n\n### 強み\n"
+_REPORT_CONCERNS_HEADING = "\n\n### 懸念点\n"
+_REPORT_RECOMMENDATION_HEADING = "\n\n## 推薦判定\n"
+_REPORT_NEXT_STEPS_HEADING = "\n\n## 次のステップ\n"
+_REPORT_NOTES_HEADING = "\n\n## 追加メモ\n"
+
+def evaluation_scores(scores: Mapping[str, int]) -> List[int]:
+    """
+    評価基準名ごとのスコアを InterviewResult.evaluations の形式に変換
+
+    全評価基準テンプレートの idx 順のリストを返す（面接段階によらず同じ長さ）。
+    スコアのない評価基準は UNSCORED とし、テンプレートにない評価基準名は無視する
+    """
+    evaluations = [UNSCORED] * len(_EVALUATION_CRITERIA)
+    for criteria_name, score in scores.items():
+        idx = _CRITERIA_INDEX.get(criteria_name)
+        if idx is not None:
+            evaluations[idx] = score
+    return evaluations
+
 def generate_interview_report(interview_plan: InterviewPlan, interview_result: InterviewResult) -> str:
     """面接レポートを生成"""
-    report = f"""
+    parts: List[str] = [f"""
 # 面接レポート
 
 ## 基本情報
@@ -480,45 +544,39 @@ def generate_interview_report(interview_plan: InterviewPlan, interview_result: I
 {interview_result.overall_impression}
 
 ### 項目別評価
-"""
+"""]
+    append = parts.append
     
+    evaluations = interview_result.evaluations
+    by_name = isinstance(evaluations, Mapping)  # 従来形式（評価基準名 → スコア）
     for criteria in interview_plan.evaluation_criteria:
-        score = interview_result.evaluations.get(criteria.criteria_name, 0)
-        level_desc = criteria.evaluation_levels.get(str(score), "未評価")
-        report += f"- **{criteria.criteria_name}**: {score}/5 - {level_desc}\n"
+        if by_name:
+            score = evaluations.get(criteria.criteria_name, 0)
+        else:
+            idx = criteria.idx
+            score = evaluations[idx] if 0 <= idx < len(evaluations) else UNSCORED
+            if score == UNSCORED:
+                score = 0  # 未評価は従来どおり「0/5 - 未評価」と表示
+        level_desc = criteria.evaluation_levels_int.get(score, "未評価")
+        append(f"- **{criteria.criteria_name}**: {score}/5 - {level_desc}\n")
     
-    report += f"""
-
-### 強み
-"""
+    append(_REPORT_STRENGTHS_HEADING)
     for strength in interview_result.strengths:
-        report += f"- {strength}\n"
+        append(f"- {strength}\n")
     
-    report += f"""
-
-### 懸念点
-"""
+    append(_REPORT_CONCERNS_HEADING)
     for concern in interview_result.concerns:
-        report += f"- {concern}\n"
+        append(f"- {concern}\n")
     
-    report += f"""
-
-## 推薦判定
-**{interview_result.recommendation.upper()}**
-
-## 次のステップ
-"""
+    append(f"{_REPORT_RECOMMENDATION_HEADING}**{interview_result.recommendation.upper()}**{_REPORT_NEXT_STEPS_HEADING}")
     for step in interview_result.next_steps:
-        report += f"- {step}\n"
+        append(f"- {step}\n")
     
     if interview_result.additional_notes:
-        report += f"""
-
-## 追加メモ
-{interview_result.additional_notes}
-"""
+        append(f"{_REPORT_NOTES_HEADING}{interview_result.additional_notes}\n")
     
-    return report
+    # 断片をリストに溜めて最後に1回だけ連結する
+    return "".join(parts)
 
 def main():
     """メイン処理のデモ"""
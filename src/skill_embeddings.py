@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+スキル埋め込みベクトル
+スキル語彙に基づく候補者・求人のベクトル化と、コサイン類似度の一括計算
+"""
+
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+class SkillVocabulary:
+    """スキル名とベクトル次元の対応表"""
+
+    def __init__(self, skills: Iterable[str]):
+        self.index: Dict[str, int] = {}
+        for skill in skills:
+            self.index.setdefault(skill, len(self.index))
+
+    @property
+    def dimension(self) -> int:
+        return len(self.index)
+
+    @property
+    def skills(self) -> List[str]:
+        """次元順のスキル名一覧"""
+        return list(self.index)
+
+    def encode(self, skill_lists: Sequence[Iterable[str]]) -> np.ndarray:
+        """
+        スキルリストをL2正規化済みのベクトル（件数 × 語彙数のfloat32行列）に変換
+
+        語彙に含まれないスキルは無視する
+        """
+        matrix = np.zeros((len(skill_lists), self.dimension), dtype=np.float32)
+        for row, skills in enumerate(skill_lists):
+            columns = [self.index[skill] for skill in skills if skill in self.index]
+            matrix[row, columns] = 1.0
+        return normalize_rows(matrix)
+
+def save_vectors(path, vectors: np.ndarray):
+    """正規化済みベクトルをfloat32の.npyとして保存"""
+    np.save(path, np.asarray(vectors, dtype=np.float32))
+
+def load_vectors(path) -> np.ndarray:
+    """保存済みベクトルを読み込み（mmapで開き、ページはプロセス間で共有される）"""
+    return np.load(path, mmap_mode='r')
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """各行をL2ノルムで正規化（ゼロベクトルはそのまま）"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+def cosine_similarity_matrix(candidate_vectors: np.ndarray, job_vectors: np.ndarray) -> np.ndarray:
+    """正規化済みベクトル同士のコサイン類似度（候補者 × 求人）を1回の行列積で計算"""
+    return np.matmul(candidate_vectors, job_vectors.T)
+
+def top_k_per_job(scores: np.ndarray, k: int) -> List[np.ndarray]:
+    """求人ごとに類似度の高い候補者インデックスを上位k件まで降順で返す"""
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return [np.empty(0, dtype=np.intp) for _ in range(scores.shape[1])]
+
+    top = np.argpartition(-scores, k - 1, axis=0)[:k]
+    ranking = []
+    for job_index in range(scores.shape[1]):
+        indices = top[:, job_index]
+        # 類似度の降順、同点は入力順
+        ranking.append(indices[np.lexsort((indices, -scores[indices, job_index]))])
+    return ranking
@@ -1,6 +1,11 @@
 """
 AI採用支援システム - WSGI エントリーポイント
 本番環境でのアプリケーション起動用
+
+gunicorn では preload（gunicorn.conf.py の preload_app）を有効にして起動する:
+    gunicorn -c gunicorn.conf.py wsgi:app
+分析エンジンと面接テンプレートはモジュール読み込み時に不変の定数として生成されるため、
+マスターで1回だけ構築され、fork 後の各ワーカーとページを共有する
 """
 
 from app import app
@@ -12,5 +17,5 @@ config_name = os.environ.get('FLASK_ENV', 'production')
 app.config.from_object(config[config_name])
 
 if __name__ == "__main__":
-    port = int(os.environ.get('PORT', 5000))
+    port = int(os.environ.get('PORT', 8000))
     app.run(host='0.0.0.0', port=port)